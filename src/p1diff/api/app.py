@@ -1,5 +1,7 @@
 """FastAPI application instance for the P1 Diff API."""
 
+from typing import Any
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -8,6 +10,25 @@ from ..logging_utils import configure_logging
 from . import __version__
 from .routes import router as api_router
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content with orjson, falling back to the stdlib encoder."""
+        if orjson is None:
+            return super().render(content)
+        try:
+            return orjson.dumps(content)
+        except orjson.JSONEncodeError:
+            return super().render(content)
+
+
 configure_logging()
 
 app = FastAPI(
@@ -16,6 +37,7 @@ app = FastAPI(
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -3,6 +3,8 @@
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
+from ..config import CHECKSUM_ALGORITHMS, CHECKSUM_ENCODINGS
+
 
 class DiffRequest(BaseModel):
     """Request model for diff endpoint."""
@@ -51,6 +53,14 @@ class DiffRequest(BaseModel):
         ge=0,
         le=100
     )
+    checksum_algo: str = Field(
+        "sha256",
+        description="Digest used for the provenance checksum (sha256 or blake2b)"
+    )
+    checksum_encoding: str = Field(
+        "hex",
+        description="Text encoding of the provenance checksum (hex or b64)"
+    )
     
     @field_validator('cap_file')
     @classmethod
@@ -72,6 +82,26 @@ class DiffRequest(BaseModel):
             raise ValueError('repo_url must be a valid URL or absolute path')
         return v
     
+    @field_validator('checksum_algo')
+    @classmethod
+    def checksum_algo_must_be_supported(cls, v):
+        """Validate the checksum algorithm name."""
+        if v not in CHECKSUM_ALGORITHMS:
+            raise ValueError(
+                f"checksum_algo must be one of: {', '.join(CHECKSUM_ALGORITHMS)}"
+            )
+        return v
+
+    @field_validator('checksum_encoding')
+    @classmethod
+    def checksum_encoding_must_be_supported(cls, v):
+        """Validate the checksum encoding name."""
+        if v not in CHECKSUM_ENCODINGS:
+            raise ValueError(
+                f"checksum_encoding must be one of: {', '.join(CHECKSUM_ENCODINGS)}"
+            )
+        return v
+
     @field_validator('commit_good', 'commit_candidate')
     @classmethod
     def commit_sha_must_be_valid(cls, v):
@@ -37,6 +37,8 @@ def create_diff(request: DiffRequest) -> Dict[str, Any]:
             cap_file=request.cap_file,
             context_lines=request.context_lines,
             find_renames_threshold=request.find_renames_threshold,
+            checksum_algo=request.checksum_algo,
+            checksum_encoding=request.checksum_encoding,
         )
         logger.info(
             "Diff request completed",
@@ -1,6 +1,8 @@
 """Service layer for P1 Diff API."""
 
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from ...caps import CapacityManager
@@ -8,11 +10,17 @@ from ...config import DiffConfig
 from ...diffpack import DiffProcessor
 from ...errors import P1DiffError
 from ...serialize import DeterministicSerializer
+from ...settings import get_diff_cache_size
 from ...vcs import GitRepository
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of diff payloads memoized per process
+DIFF_CACHE_SIZE = get_diff_cache_size()
+# Full SHA-1 or SHA-256 object names; anything else may be a ref that moves
+_FULL_SHA_PATTERN = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
 
 def collect_notes(
     files: list,
@@ -39,6 +47,102 @@ def collect_notes(
     return notes
 
 
+def compute_diff(config: DiffConfig) -> Dict[str, Any]:
+    """Compute the diff payload for a configuration.
+
+    Payloads are memoized only when both commits are full object names,
+    whose content cannot change. Branch names, tags, abbreviated SHAs and
+    relative refs may resolve differently between requests, so they are
+    always recomputed. Callers must treat the returned payload as read-only
+    since a cached payload is shared.
+    """
+    if _FULL_SHA_PATTERN.fullmatch(
+        config.commit_good
+    ) and _FULL_SHA_PATTERN.fullmatch(config.commit_candidate):
+        return cached_compute_diff(config)
+    return _build_diff_payload(config)
+
+
+def _build_diff_payload(config: DiffConfig) -> Dict[str, Any]:
+    """Clone, diff, cap and serialize the commits named by a configuration."""
+    logger.debug("Initializing Git repository", extra={"repo": config.repo_url})
+    with GitRepository(config) as repo:
+        repo.clone_and_setup()
+        logger.info("Repository cloned", extra={"repo": config.repo_url})
+        git_version = repo.validate_git_version()
+
+        file_changes = repo.get_file_changes()
+        logger.info(
+            "Collected file changes",
+            extra={"repo": config.repo_url, "changes": len(file_changes)},
+        )
+
+        diff_processor = DiffProcessor()
+        processed_files = []
+        eol_changes = 0
+        whitespace_changes = 0
+
+        for change in file_changes:
+            logger.debug(
+                "Processing change",
+                extra={
+                    "repo": config.repo_url,
+                    "path": change.path_new or change.path_old,
+                    "status": change.status,
+                },
+            )
+            unified_diff = ""
+            if not change.is_binary and not change.is_submodule:
+                unified_diff = repo.get_unified_diff(change)
+
+            processed_file = diff_processor.process_file_change(change, unified_diff)
+            processed_files.append(processed_file)
+            if processed_file.eol_only_change:
+                eol_changes += 1
+            if processed_file.whitespace_only_change:
+                whitespace_changes += 1
+
+        capacity_manager = CapacityManager(config)
+        final_files, omitted_files_count = capacity_manager.apply_caps(processed_files)
+        logger.info(
+            "Capacity management applied",
+            extra={
+                "repo": config.repo_url,
+                "files_returned": len(final_files),
+                "omitted_files": omitted_files_count,
+            },
+        )
+
+        notes = collect_notes(
+            final_files,
+            omitted_files_count,
+            eol_changes,
+            whitespace_changes,
+            capacity_manager.stats["summarized_files"],
+        )
+
+        serializer = DeterministicSerializer(config)
+        payload = serializer.serialize_output(
+            final_files, omitted_files_count, notes, git_version
+        )
+
+        logger.info(
+            "Serialization complete",
+            extra={
+                "repo": config.repo_url,
+                "files": len(final_files),
+                "notes": len(notes),
+                "git_version": git_version,
+            },
+        )
+
+        return payload
+
+
+# Memoized variant for immutable commit pairs; failed runs raise and are not cached
+cached_compute_diff = lru_cache(maxsize=DIFF_CACHE_SIZE)(_build_diff_payload)
+
+
 class DiffService:
     """Service class that encapsulates the core diff processing logic."""
 
@@ -52,6 +156,8 @@ class DiffService:
         cap_file: int = 64000,
         context_lines: int = 3,
         find_renames_threshold: int = 90,
+        checksum_algo: str = "sha256",
+        checksum_encoding: str = "hex",
     ) -> Dict[str, Any]:
         """Process a diff request and return the complete JSON response."""
         logger.info(
@@ -69,12 +175,13 @@ class DiffService:
                 cap_file=cap_file,
                 context_lines=context_lines,
                 find_renames_threshold=find_renames_threshold,
+                checksum_algo=checksum_algo,
+                checksum_encoding=checksum_encoding,
             )
 
             payload = self._process_diff_core(config)
 
-            serializer = DeterministicSerializer(config)
-            result = serializer.create_success_envelope(payload)
+            result = DeterministicSerializer.create_success_envelope(payload)
 
             logger.info(
                 "Diff processing succeeded",
@@ -92,13 +199,13 @@ class DiffService:
                 "Known P1 diff error",
                 extra={"repo": repo_url, "code": exc.code},
             )
-            serializer = DeterministicSerializer(DiffConfig("", "", ""))
-            return serializer.create_error_envelope(exc.code, exc.message, exc.details)
+            return DeterministicSerializer.create_error_envelope(
+                exc.code, exc.message, exc.details
+            )
 
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.exception("Unexpected error during diff processing", extra={"repo": repo_url})
-            serializer = DeterministicSerializer(DiffConfig("", "", ""))
-            return serializer.create_error_envelope(
+            return DeterministicSerializer.create_error_envelope(
                 "INTERNAL_ERROR",
                 f"Internal error: {str(exc)}",
                 {"exception_type": type(exc).__name__},
@@ -106,73 +213,4 @@ class DiffService:
 
     def _process_diff_core(self, config: DiffConfig) -> Dict[str, Any]:
         """Core diff processing logic shared by the API."""
-        logger.debug("Initializing Git repository", extra={"repo": config.repo_url})
-        with GitRepository(config) as repo:
-            repo.clone_and_setup()
-            logger.info("Repository cloned", extra={"repo": config.repo_url})
-            git_version = repo.validate_git_version()
-
-            file_changes = repo.get_file_changes()
-            logger.info(
-                "Collected file changes",
-                extra={"repo": config.repo_url, "changes": len(file_changes)},
-            )
-
-            diff_processor = DiffProcessor()
-            processed_files = []
-
-            for change in file_changes:
-                logger.debug(
-                    "Processing change",
-                    extra={
-                        "repo": config.repo_url,
-                        "path": change.path_new or change.path_old,
-                        "status": change.status,
-                    },
-                )
-                unified_diff = ""
-                if not change.is_binary and not change.is_submodule:
-                    unified_diff = repo.get_unified_diff(change)
-
-                processed_file = diff_processor.process_file_change(change, unified_diff)
-                processed_files.append(processed_file)
-
-            capacity_manager = CapacityManager(config)
-            final_files, omitted_files_count = capacity_manager.apply_caps(processed_files)
-            logger.info(
-                "Capacity management applied",
-                extra={
-                    "repo": config.repo_url,
-                    "files_returned": len(final_files),
-                    "omitted_files": omitted_files_count,
-                },
-            )
-
-            eol_changes = sum(1 for f in final_files if f.eol_only_change)
-            whitespace_changes = sum(1 for f in final_files if f.whitespace_only_change)
-            summarized_lockfiles = sum(1 for f in final_files if f.summarized)
-
-            notes = collect_notes(
-                final_files,
-                omitted_files_count,
-                eol_changes,
-                whitespace_changes,
-                summarized_lockfiles,
-            )
-
-            serializer = DeterministicSerializer(config)
-            payload = serializer.serialize_output(
-                final_files, omitted_files_count, notes, git_version
-            )
-
-            logger.info(
-                "Serialization complete",
-                extra={
-                    "repo": config.repo_url,
-                    "files": len(final_files),
-                    "notes": len(notes),
-                    "git_version": git_version,
-                },
-            )
-
-            return payload
+        return compute_diff(config)
@@ -1,7 +1,9 @@
 """Capacity management and truncation logic for P1 Diff tool."""
 
 import logging
-from typing import List, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Tuple
 
 from .config import DiffConfig
 from .diffpack import DiffHunk, ProcessedFile
@@ -18,12 +20,31 @@ class CapacityManager:
         self.config = config
         self.total_bytes_used = 0
         self.omitted_files_count = 0
+        self.truncated_files_count = 0
+        self.summarized_files_count = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters from the most recent apply_caps pass."""
+        return {
+            "total_bytes": self.total_bytes_used,
+            "omitted_files": self.omitted_files_count,
+            "truncated_files": self.truncated_files_count,
+            "summarized_files": self.summarized_files_count,
+        }
 
     def apply_caps(self, files: List[ProcessedFile]) -> Tuple[List[ProcessedFile], int]:
-        """Apply capacity limits to files and return processed files and omitted count."""
+        """Apply capacity limits to files and return processed files and omitted count.
+
+        Files are admitted in input order. Each file is first held to the per-file
+        cap; a file that then does not fit in the remaining total budget is omitted
+        whole, and later smaller files may still be admitted.
+        """
         processed_files = []
         self.total_bytes_used = 0
         self.omitted_files_count = 0
+        self.truncated_files_count = 0
+        self.summarized_files_count = 0
 
         for file in files:
             logger.debug(
@@ -34,19 +55,21 @@ class CapacityManager:
                 },
             )
 
-            original_file_size = self._calculate_file_size(file)
-            if original_file_size > self.config.cap_file:
+            final_file_size = self._calculate_file_size(file)
+            if final_file_size > self.config.cap_file:
                 logger.info(
                     "Applying per-file cap",
                     extra={
                         "path": file.path_new or file.path_old,
-                        "size": original_file_size,
+                        "size": final_file_size,
                         "cap": self.config.cap_file,
                     },
                 )
-                file = self._apply_per_file_cap(file)
-
-            final_file_size = self._calculate_file_size(file)
+                file, final_file_size = self._apply_per_file_cap(file)
+                if file.summarized:
+                    self.summarized_files_count += 1
+                elif file.truncated:
+                    self.truncated_files_count += 1
 
             if self.total_bytes_used + final_file_size > self.config.cap_total:
                 logger.info(
@@ -59,7 +82,7 @@ class CapacityManager:
                     },
                 )
                 original_hunk_count = len(file.hunks) if file.hunks else 0
-                file.hunks = []
+                file.set_hunks([])
                 file.omitted_hunks_count = original_hunk_count
                 self.omitted_files_count += 1
                 processed_files.append(file)
@@ -70,59 +93,49 @@ class CapacityManager:
 
         logger.info(
             "Capacity processing complete",
-            extra={
-                "files_returned": len(processed_files),
-                "total_bytes": self.total_bytes_used,
-                "omitted_files": self.omitted_files_count,
-            },
+            extra={"files_returned": len(processed_files), **self.stats},
         )
         return processed_files, self.omitted_files_count
 
     def _calculate_file_size(self, file: ProcessedFile) -> int:
         """Calculate the size of a file's patch content in UTF-8 bytes."""
-        if not file.hunks:
-            return 0
-
-        total_size = 0
-        for hunk in file.hunks:
-            total_size += len(hunk.patch.encode("utf-8"))
+        return file.size_bytes
 
-        return total_size
-
-    def _apply_per_file_cap(self, file: ProcessedFile) -> ProcessedFile:
-        """Apply per-file capacity limit with intelligent truncation."""
+    def _apply_per_file_cap(self, file: ProcessedFile) -> Tuple[ProcessedFile, int]:
+        """Apply per-file capacity limit and return the file with its kept size."""
         if not file.hunks:
-            return file
+            return file, 0
 
         file_path = file.path_new or file.path_old
         if file_path and FilePolicies.should_summarize_when_oversized(file_path):
             original_hunk_count = len(file.hunks)
             file.summarized = True
-            file.hunks = []
+            file.set_hunks([])
             file.omitted_hunks_count = original_hunk_count
             logger.info(
                 "Summarizing oversized generated file",
                 extra={"path": file_path, "omitted_hunks": original_hunk_count},
             )
-            return file
+            return file, 0
 
         original_hunk_count = len(file.hunks)
-        truncated_hunks = []
-        current_size = 0
-
-        for hunk in file.hunks:
-            hunk_size = len(hunk.patch.encode("utf-8"))
-            if current_size + hunk_size <= self.config.cap_file:
-                truncated_hunks.append(hunk)
-                current_size += hunk_size
-            else:
-                remaining_space = self.config.cap_file - current_size
-                if remaining_space > 50:
-                    truncated_hunk = self._truncate_hunk_context(hunk, remaining_space)
-                    if truncated_hunk:
-                        truncated_hunks.append(truncated_hunk)
-                        current_size += len(truncated_hunk.patch.encode("utf-8"))
-                break
+
+        # Running totals are non-decreasing, so the longest prefix of hunks
+        # that fits the cap is found with a single bisection
+        running_sizes = list(accumulate(file.hunk_sizes))
+        cutoff = bisect_right(running_sizes, self.config.cap_file)
+        truncated_hunks = file.hunks[:cutoff]
+        current_size = running_sizes[cutoff - 1] if cutoff else 0
+
+        if cutoff < original_hunk_count:
+            remaining_space = self.config.cap_file - current_size
+            if remaining_space > 50:
+                truncated_hunk = self._truncate_hunk_context(
+                    file.hunks[cutoff], remaining_space
+                )
+                if truncated_hunk:
+                    truncated_hunks.append(truncated_hunk)
+                    current_size += truncated_hunk.byte_size
 
         omitted_count = original_hunk_count - len(truncated_hunks)
         if omitted_count > 0:
@@ -133,8 +146,8 @@ class CapacityManager:
                 extra={"path": file_path, "omitted_hunks": omitted_count},
             )
 
-        file.hunks = truncated_hunks
-        return file
+        file.set_hunks(truncated_hunks)
+        return file, current_size
 
     def _truncate_hunk_context(self, hunk: DiffHunk, max_size: int) -> DiffHunk:
         """Truncate hunk context to fit within size limit."""
@@ -155,20 +168,18 @@ class CapacityManager:
                 context_lines.append(line)
 
         if len(context_lines) > 2:
-            minimal_lines = [header_line]
-            if context_lines:
-                minimal_lines.append(context_lines[0])
-            minimal_lines.extend(change_lines)
-            if len(context_lines) > 1:
-                minimal_lines.append(context_lines[-1])
-
-            minimal_patch = "\n".join(minimal_lines)
-            if len(minimal_patch.encode("utf-8")) <= max_size:
-                logger.debug(
-                    "Created truncated hunk",
-                    extra={"added": hunk.added, "deleted": hunk.deleted},
-                )
-                return DiffHunk(
+            minimal_lines = [
+                header_line,
+                context_lines[0],
+                *change_lines,
+                context_lines[-1],
+            ]
+
+            # Characters never exceed UTF-8 bytes, so an oversized candidate can be
+            # rejected from line lengths alone before joining or encoding it
+            minimal_chars = sum(map(len, minimal_lines)) + len(minimal_lines) - 1
+            if minimal_chars <= max_size:
+                truncated_hunk = DiffHunk(
                     header=hunk.header,
                     old_start=hunk.old_start,
                     old_lines=hunk.old_lines,
@@ -176,8 +187,14 @@ class CapacityManager:
                     new_lines=hunk.new_lines,
                     added=hunk.added,
                     deleted=hunk.deleted,
-                    patch=minimal_patch,
+                    patch="\n".join(minimal_lines),
                 )
+                if truncated_hunk.byte_size <= max_size:
+                    logger.debug(
+                        "Created truncated hunk",
+                        extra={"added": hunk.added, "deleted": hunk.deleted},
+                    )
+                    return truncated_hunk
 
         logger.debug("Unable to truncate hunk within remaining space")
         return None
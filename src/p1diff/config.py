@@ -2,7 +2,30 @@
 
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Platform-appropriate null device for disabling user and system git config
+_NULL_DEVICE = "NUL" if os.name == "nt" else "/dev/null"
+
+# Digest algorithms accepted for the provenance checksum
+CHECKSUM_ALGORITHMS = ("sha256", "blake2b")
+# Text encodings accepted for the provenance checksum digest
+CHECKSUM_ENCODINGS = ("hex", "b64")
+
+# Environment overrides applied to every git invocation
+GIT_ENV_LOCKS: Mapping[str, str] = MappingProxyType(
+    {
+        "LC_ALL": "C",
+        "GIT_CONFIG_GLOBAL": _NULL_DEVICE,
+        "GIT_CONFIG_SYSTEM": _NULL_DEVICE,
+        "GIT_TERMINAL_PROMPT": "0",
+        "GIT_ASKPASS": "echo",
+        "SSH_ASKPASS": "echo",
+        "GCM_INTERACTIVE": "never",
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -35,6 +58,11 @@ class DiffConfig:
     # Git environment settings
     diff_algorithm: str = "myers"
 
+    # Provenance checksum digest (blake2b uses a 256-bit digest)
+    checksum_algo: str = "sha256"
+    # Digest text form: 64 hex characters or 44 padded base64 characters
+    checksum_encoding: str = "hex"
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         if self.cap_total <= 0:
@@ -47,31 +75,28 @@ class DiffConfig:
             raise ValueError("context_lines cannot be negative")
         if not (0 <= self.find_renames_threshold <= 100):
             raise ValueError("find_renames_threshold must be between 0 and 100")
+        if self.checksum_algo not in CHECKSUM_ALGORITHMS:
+            raise ValueError(
+                f"checksum_algo must be one of: {', '.join(CHECKSUM_ALGORITHMS)}"
+            )
+        if self.checksum_encoding not in CHECKSUM_ENCODINGS:
+            raise ValueError(
+                f"checksum_encoding must be one of: {', '.join(CHECKSUM_ENCODINGS)}"
+            )
 
     @property
     def git_env(self) -> Dict[str, str]:
         """Get Git environment variables for deterministic output."""
-        env = os.environ.copy()
-        
-        # Use platform-appropriate null device
-        null_device = "NUL" if os.name == "nt" else "/dev/null"
-        
-        env.update(
-            {
-                "LC_ALL": "C",
-                "GIT_CONFIG_GLOBAL": null_device,
-                "GIT_CONFIG_SYSTEM": null_device,
-                "GIT_TERMINAL_PROMPT": "0",
-                "GIT_ASKPASS": "echo",
-                "SSH_ASKPASS": "echo",
-                "GCM_INTERACTIVE": "never",
-            }
-        )
-        return env
+        return {**os.environ, **GIT_ENV_LOCKS}
 
-    def to_provenance_dict(self) -> Dict[str, Any]:
-        """Convert config to provenance dictionary for output."""
-        return {
+    @cached_property
+    def provenance(self) -> Dict[str, Any]:
+        """Provenance dictionary for output, built once per config.
+
+        Non-default checksum settings are recorded so the checksum can be
+        reproduced; defaults are left out to keep existing checksums stable.
+        """
+        provenance: Dict[str, Any] = {
             "repo_url": self.repo_url,
             "commit_good": self.commit_good,
             "commit_candidate": self.commit_candidate,
@@ -92,3 +117,16 @@ class DiffConfig:
                 "core.autocrlf": "false",
             },
         }
+        if self.checksum_algo != "sha256":
+            provenance["checksum_algo"] = self.checksum_algo
+        if self.checksum_encoding != "hex":
+            provenance["checksum_encoding"] = self.checksum_encoding
+        return provenance
+
+    def to_provenance_dict(self) -> Dict[str, Any]:
+        """Convert config to provenance dictionary for output.
+
+        Returns a shallow copy so callers may add top-level keys; the nested
+        sections are shared with the cached provenance and must not be mutated.
+        """
+        return dict(self.provenance)
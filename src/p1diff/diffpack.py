@@ -2,15 +2,45 @@
 
 import logging
 import re
-from dataclasses import dataclass
+import sys
+from array import array
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
 from .vcs import FileChange
 
 logger = logging.getLogger(__name__)
 
+# Deletion tables used to normalize changed lines before comparison
+_EOL_TABLE = str.maketrans("", "", "\r")
+# Every ASCII character str.split() treats as whitespace, including \x1c-\x1f
+_WS_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c).isspace())
+)
 
-@dataclass
+# Change classification flags returned by DiffProcessor._classify_change
+CHANGE_EOL_ONLY = 1
+CHANGE_WHITESPACE_ONLY = 2
+
+# File header lines that look like added/removed lines but are not content
+_FILE_HEADER_PREFIXES = ("+++", "---")
+
+# Hunk header at the start of a line
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+# Full hunk header lines located anywhere in a unified diff
+_HUNK_LINE_PATTERN = re.compile(HUNK_HEADER_PATTERN.pattern + ".*$", re.MULTILINE)
+
+
+def _strip_whitespace(text: str) -> str:
+    """Remove all whitespace, with the same definition as str.split()."""
+    if text.isascii():
+        return text.translate(_WS_TABLE)
+    # Unicode whitespace such as U+00A0 and U+3000 is outside the ASCII table
+    return "".join(text.split())
+
+
+@dataclass(slots=True)
 class DiffHunk:
     """Represents a single diff hunk."""
 
@@ -23,8 +53,19 @@ class DiffHunk:
     deleted: int
     patch: str
 
+    # UTF-8 size of the patch, computed once for capacity accounting
+    byte_size: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the encoded size of the patch."""
+        # ASCII text encodes to one byte per character, so skip the encode
+        if self.patch.isascii():
+            self.byte_size = len(self.patch)
+        else:
+            self.byte_size = len(self.patch.encode("utf-8"))
+
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFile:
     """Represents a processed file with metadata and hunks."""
 
@@ -56,20 +97,62 @@ class ProcessedFile:
     # Diff hunks
     hunks: List[DiffHunk] = None
 
+    # Hunk sizes and their total, keyed on the hunks list and length they came from
+    _size_cache: Optional[Tuple[List[DiffHunk], int, array, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
-        """Initialize hunks list if not provided."""
+        """Initialize hunks list if not provided and share categorical strings."""
         if self.hunks is None:
             self.hunks = []
 
+        # Status and mode values repeat across every file of a large diff
+        self.status = sys.intern(self.status)
+        if self.mode_old is not None:
+            self.mode_old = sys.intern(self.mode_old)
+        if self.mode_new is not None:
+            self.mode_new = sys.intern(self.mode_new)
+        if self.rename_tiebreaker is not None:
+            self.rename_tiebreaker = sys.intern(self.rename_tiebreaker)
+
+    @property
+    def hunk_sizes(self) -> array:
+        """UTF-8 sizes of the file's hunks as a contiguous int64 array.
+
+        Reassign ``hunks`` (or call ``set_hunks``) rather than replacing entries
+        in place so the cached sizes are invalidated.
+        """
+        return self._sizes()[2]
+
+    @property
+    def size_bytes(self) -> int:
+        """Total UTF-8 size of the file's hunks, recomputed only when hunks change."""
+        return self._sizes()[3]
+
+    def _sizes(self) -> Tuple[List[DiffHunk], int, array, int]:
+        """Return the size cache, rebuilding it if the hunks list has changed."""
+        # __post_init__ guarantees a list, so the identity check also hits for
+        # empty files. The cache references the list it was built from until
+        # the next access or set_hunks, which drops it immediately.
+        hunks = self.hunks
+        cache = self._size_cache
+        if cache is None or cache[0] is not hunks or cache[1] != len(hunks):
+            sizes = array("q", [hunk.byte_size for hunk in hunks])
+            cache = (hunks, len(hunks), sizes, sum(sizes))
+            self._size_cache = cache
+        return cache
+
+    def set_hunks(self, hunks: List[DiffHunk]) -> None:
+        """Replace the hunks and drop cached sizes so the old list can be freed."""
+        self.hunks = hunks
+        self._size_cache = None
+
 
 class DiffProcessor:
     """Processes unified diffs into structured hunks."""
 
-    def __init__(self):
-        """Initialize diff processor."""
-        self.hunk_header_pattern = re.compile(
-            r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@"
-        )
+    hunk_header_pattern = HUNK_HEADER_PATTERN
 
     def process_file_change(
         self, change: FileChange, unified_diff: str
@@ -108,9 +191,10 @@ class DiffProcessor:
 
         if not change.is_binary and not change.is_submodule and unified_diff:
             processed.hunks = self._split_into_hunks(unified_diff)
-            processed.eol_only_change = self._detect_eol_only_change(unified_diff)
-            processed.whitespace_only_change = self._detect_whitespace_only_change(
-                unified_diff
+            change_flags = self._classify_change(unified_diff)
+            processed.eol_only_change = bool(change_flags & CHANGE_EOL_ONLY)
+            processed.whitespace_only_change = bool(
+                change_flags & CHANGE_WHITESPACE_ONLY
             )
 
         logger.debug(
@@ -127,97 +211,91 @@ class DiffProcessor:
     def _split_into_hunks(self, unified_diff: str) -> List[DiffHunk]:
         """Split unified diff into individual hunks."""
         hunks = []
-        lines = unified_diff.split("\n")
-
-        current_hunk_lines: List[str] = []
-        current_header = None
-        current_header_match = None
-
-        for line in lines:
-            header_match = self.hunk_header_pattern.match(line)
-            if header_match:
-                if current_header and current_hunk_lines:
-                    hunk = self._create_hunk(
-                        current_header, current_header_match, current_hunk_lines
-                    )
-                    if hunk:
-                        hunks.append(hunk)
-
-                current_header = line
-                current_header_match = header_match
-                current_hunk_lines = []
-            elif current_header:
-                current_hunk_lines.append(line)
-
-        if current_header and current_hunk_lines:
-            hunk = self._create_hunk(
-                current_header, current_header_match, current_hunk_lines
-            )
-            if hunk:
-                hunks.append(hunk)
+        matches = list(_HUNK_LINE_PATTERN.finditer(unified_diff))
+
+        for index, match in enumerate(matches):
+            # A hunk runs up to the newline before the next header
+            if index + 1 < len(matches):
+                end = matches[index + 1].start() - 1
+            else:
+                end = len(unified_diff)
+            if end <= match.end():
+                # Header without any body lines
+                continue
+
+            patch = unified_diff[match.start() : end]
+            added = patch.count("\n+") - patch.count("\n+++")
+            deleted = patch.count("\n-") - patch.count("\n---")
+            hunks.append(self._build_hunk(match.group(0), match, patch, added, deleted))
 
         logger.debug("Split unified diff into %s hunks", len(hunks))
         return hunks
 
-    def _create_hunk(
-        self, header: str, header_match: re.Match, lines: List[str]
-    ) -> Optional[DiffHunk]:
-        """Create a DiffHunk from header and lines."""
-        old_start = int(header_match.group(1))
-        old_lines = int(header_match.group(2) or "1")
-        new_start = int(header_match.group(3))
-        new_lines = int(header_match.group(4) or "1")
-
-        added = 0
-        deleted = 0
-        patch_lines = [header]
-
-        for line in lines:
-            if line.startswith("+") and not line.startswith("+++"):
-                added += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deleted += 1
-            patch_lines.append(line)
-
-        patch = "\n".join(patch_lines)
-
+    def _build_hunk(
+        self,
+        header: str,
+        header_match: re.Match,
+        patch: str,
+        added: int,
+        deleted: int,
+    ) -> DiffHunk:
+        """Build a DiffHunk from a parsed header and its patch text."""
         return DiffHunk(
             header=header,
-            old_start=old_start,
-            old_lines=old_lines,
-            new_start=new_start,
-            new_lines=new_lines,
+            old_start=int(header_match.group(1)),
+            old_lines=int(header_match.group(2) or "1"),
+            new_start=int(header_match.group(3)),
+            new_lines=int(header_match.group(4) or "1"),
             added=added,
             deleted=deleted,
             patch=patch,
         )
 
+    def _collect_changed_lines(self, unified_diff: str) -> Tuple[List[str], List[str]]:
+        """Collect removed and added line contents in a single pass."""
+        removed: List[str] = []
+        added: List[str] = []
+
+        for line in unified_diff.split("\n"):
+            if line.startswith(_FILE_HEADER_PREFIXES):
+                continue
+            if line.startswith("-"):
+                removed.append(line[1:])
+            elif line.startswith("+"):
+                added.append(line[1:])
+
+        return removed, added
+
+    def _classify_change(self, unified_diff: str) -> int:
+        """Classify a change as EOL-only and/or whitespace-only in one scan."""
+        removed, added = self._collect_changed_lines(unified_diff)
+
+        flags = 0
+        if self._is_eol_only(removed, added):
+            flags |= CHANGE_EOL_ONLY
+        if self._is_whitespace_only(removed, added):
+            flags |= CHANGE_WHITESPACE_ONLY
+        return flags
+
     def _detect_eol_only_change(self, unified_diff: str) -> bool:
         """Detect if change is only end-of-line differences."""
-        lines = unified_diff.split("\n")
-        removed = [
-            line[1:]
-            for line in lines
-            if line.startswith("-") and not line.startswith("---")
-        ]
-        added = [
-            line[1:]
-            for line in lines
-            if line.startswith("+") and not line.startswith("+++")
-        ]
+        return self._is_eol_only(*self._collect_changed_lines(unified_diff))
 
+    def _detect_whitespace_only_change(self, unified_diff: str) -> bool:
+        """Detect if change is only whitespace differences."""
+        return self._is_whitespace_only(*self._collect_changed_lines(unified_diff))
+
+    def _is_eol_only(self, removed: List[str], added: List[str]) -> bool:
+        """Check whether removed and added lines differ only in line endings."""
         if not removed and not added:
             return False
 
         if len(removed) != len(added):
             return False
 
-        def _normalize(values: List[str]) -> str:
-            normalized = "\n".join(values)
-            normalized = normalized.replace("\r\n", "\n").replace("\r", "")
-            return normalized
-
-        if _normalize(removed) == _normalize(added):
+        if "\n".join(removed).translate(_EOL_TABLE) == "\n".join(added).translate(
+            _EOL_TABLE
+        ):
             logger.debug("Detected EOL-only change via normalization")
             return True
 
@@ -254,23 +332,15 @@ class DiffProcessor:
         logger.debug("Detected EOL-only change via suffix comparison")
         return True
 
-    def _detect_whitespace_only_change(self, unified_diff: str) -> bool:
-        """Detect if change is only whitespace differences."""
-        lines = unified_diff.split("\n")
-        old_content = []
-        new_content = []
-
-        for line in lines:
-            if line.startswith("-") and not line.startswith("---"):
-                old_content.append(line[1:])
-            elif line.startswith("+") and not line.startswith("+++"):
-                new_content.append(line[1:])
-
+    def _is_whitespace_only(
+        self, old_content: List[str], new_content: List[str]
+    ) -> bool:
+        """Check whether removed and added lines differ only in whitespace."""
         if not old_content and not new_content:
             return False
 
-        old_normalized = "".join("".join(line.split()) for line in old_content)
-        new_normalized = "".join("".join(line.split()) for line in new_content)
+        old_normalized = _strip_whitespace("".join(old_content))
+        new_normalized = _strip_whitespace("".join(new_content))
 
         result = old_normalized == new_normalized and old_content != new_content
         if result:
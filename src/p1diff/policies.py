@@ -1,77 +1,84 @@
 """File type policies and detection for P1 Diff tool."""
 
-import os
-from pathlib import Path
-from typing import Set
+import re
+from typing import Optional
 
 
 class FilePolicies:
     """Policies for handling different file types."""
 
     # Lockfiles and generated files that should be summarized when oversized
-    LOCKFILES = {
-        # JavaScript/Node.js
-        "package-lock.json",
-        "yarn.lock",
-        "pnpm-lock.yaml",
-        "npm-shrinkwrap.json",
-        # Python
-        "poetry.lock",
-        "Pipfile.lock",
-        # Java
-        "gradle.lockfile",
-        # Ruby
-        "Gemfile.lock",
-        # PHP
-        "composer.lock",
-        # Rust
-        "Cargo.lock",
-        # Go
-        "go.sum",
-        # Swift
-        "Package.resolved",
-        # Elixir
-        "mix.lock",
-        # .NET
-        "packages.lock.json",
-    }
+    LOCKFILES = frozenset(
+        {
+            # JavaScript/Node.js
+            "package-lock.json",
+            "yarn.lock",
+            "pnpm-lock.yaml",
+            "npm-shrinkwrap.json",
+            # Python
+            "poetry.lock",
+            "Pipfile.lock",
+            # Java
+            "gradle.lockfile",
+            # Ruby
+            "Gemfile.lock",
+            # PHP
+            "composer.lock",
+            # Rust
+            "Cargo.lock",
+            # Go
+            "go.sum",
+            # Swift
+            "Package.resolved",
+            # Elixir
+            "mix.lock",
+            # .NET
+            "packages.lock.json",
+        }
+    )
+
+    # Suffixes used by lockfiles not listed by name (e.g. flake.lock, uv.lock)
+    LOCKFILE_SUFFIXES = (".lock", ".lockfile")
 
     # File extensions for minified/generated files
     MINIFIED_EXTENSIONS = {".min.js", ".min.css"}
     MAP_EXTENSIONS = {".map", ".js.map", ".css.map"}
 
+    # Single end-anchored pattern classifying minified files and source maps
+    _CATEGORY_PATTERN = re.compile(
+        r"(?:(?P<minified>{})|(?P<source_map>{}))\Z".format(
+            "|".join(map(re.escape, sorted(MINIFIED_EXTENSIONS))),
+            "|".join(map(re.escape, sorted(MAP_EXTENSIONS))),
+        )
+    )
+
     @classmethod
     def is_lockfile(cls, file_path: str) -> bool:
         """Check if file is a lockfile."""
-        filename = os.path.basename(file_path)
-        return filename in cls.LOCKFILES
+        # Diff paths always use "/" separators, regardless of platform
+        filename = file_path.rsplit("/", 1)[-1]
+        return filename in cls.LOCKFILES or filename.endswith(cls.LOCKFILE_SUFFIXES)
+
+    @classmethod
+    def _suffix_category(cls, file_path: str) -> Optional[str]:
+        """Return "minified" or "source_map" from the path suffix, if any."""
+        match = cls._CATEGORY_PATTERN.search(file_path)
+        return match.lastgroup if match else None
 
     @classmethod
     def is_minified(cls, file_path: str) -> bool:
         """Check if file is minified."""
-        path = Path(file_path)
-        return any(
-            path.name.endswith(ext) or path.suffix in cls.MINIFIED_EXTENSIONS
-            for ext in cls.MINIFIED_EXTENSIONS
-        )
+        return cls._suffix_category(file_path) == "minified"
 
     @classmethod
     def is_source_map(cls, file_path: str) -> bool:
         """Check if file is a source map."""
-        path = Path(file_path)
-        return any(
-            path.name.endswith(ext) or path.suffix in cls.MAP_EXTENSIONS
-            for ext in cls.MAP_EXTENSIONS
-        )
+        return cls._suffix_category(file_path) == "source_map"
 
     @classmethod
     def is_generated_file(cls, file_path: str) -> bool:
         """Check if file is likely generated."""
-        return (
-            cls.is_lockfile(file_path)
-            or cls.is_minified(file_path)
-            or cls.is_source_map(file_path)
-        )
+        return cls.is_lockfile(file_path) or cls._suffix_category(file_path) is not None
 
     @classmethod
     def should_summarize_when_oversized(cls, file_path: str) -> bool:
@@ -83,9 +90,4 @@ class FilePolicies:
         """Get category of file for notes/logging."""
         if cls.is_lockfile(file_path):
             return "lockfile"
-        elif cls.is_minified(file_path):
-            return "minified"
-        elif cls.is_source_map(file_path):
-            return "source_map"
-        else:
-            return "regular"
+        return cls._suffix_category(file_path) or "regular"
@@ -1,19 +1,92 @@
 """Deterministic serialization for P1 Diff tool."""
 
+import base64
 import hashlib
 import json
 import logging
-from typing import Any, Dict, List
+from functools import partial
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Dict, List, Optional
 
 from .config import DiffConfig
 from .diffpack import ProcessedFile
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Hash constructors for DiffConfig.checksum_algo; both yield 64 hex characters
+_CHECKSUM_HASHERS: Dict[str, Callable[[bytes], Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": partial(hashlib.blake2b, digest_size=32),
+}
+
+
+def _b64digest(digest: Any) -> str:
+    """Encode a finished hash as padded standard base64."""
+    return base64.b64encode(digest.digest()).decode("ascii")
+
+
+# Digest text encoders for DiffConfig.checksum_encoding
+_CHECKSUM_ENCODERS: Dict[str, Callable[[Any], str]] = {
+    "hex": methodcaller("hexdigest"),
+    "b64": _b64digest,
+}
+
+
+def _checksum_text(json_bytes: bytes, algo: str, encoding: str) -> str:
+    """Hash canonical JSON bytes and encode the digest as text."""
+    return _CHECKSUM_ENCODERS[encoding](_CHECKSUM_HASHERS[algo](json_bytes))
+
+
+# Hunk order within a file; attrgetter extracts both keys in C
+_HUNK_SORT_KEY = attrgetter("old_start", "new_start")
+
+
+def _path_status_key(
+    path_new: Optional[str], path_old: Optional[str], status: str
+) -> tuple:
+    """Order files by effective path (new, falling back to old), then status."""
+    return (path_new or path_old or "", status)
+
+
+def _file_order(file: ProcessedFile) -> tuple:
+    """Sort key for ProcessedFile objects."""
+    return _path_status_key(file.path_new, file.path_old, file.status)
+
+
+def _is_set(value: Any) -> bool:
+    """Include values that are present, even if falsy."""
+    return value is not None
+
+
+def _is_positive(value: Any) -> bool:
+    """Include counts only when something was counted."""
+    return value is not None and value > 0
+
+
+# Optional ProcessedFile attributes and when each is emitted; flags and
+# submodule data only appear when truthy
+_OPTIONAL_FILE_FIELDS = (
+    ("rename_score", _is_set),
+    ("rename_tiebreaker", _is_set),
+    ("eol_only_change", bool),
+    ("whitespace_only_change", bool),
+    ("summarized", bool),
+    ("truncated", bool),
+    ("omitted_hunks_count", _is_positive),
+    ("submodule", bool),
+)
+
 
 class DeterministicSerializer:
     """Handles deterministic JSON serialization with stable ordering."""
 
+    __slots__ = ("config",)
+
     def __init__(self, config: DiffConfig):
         """Initialize with configuration."""
         self.config = config
@@ -38,8 +111,10 @@ class DeterministicSerializer:
         provenance = self.config.to_provenance_dict()
         provenance["git_version"] = git_version
 
-        files_data = [self._serialize_file(file) for file in files]
-        files_data.sort(key=self._file_sort_key)
+        # Order the files themselves so the dicts are built already sorted
+        files_data = [
+            self._serialize_file(file) for file in sorted(files, key=_file_order)
+        ]
 
         payload = {
             "provenance": provenance,
@@ -48,7 +123,8 @@ class DeterministicSerializer:
             "notes": sorted(notes),
         }
 
-        checksum = self._compute_checksum(payload)
+        # The payload is assembled in normalized order and has no checksum yet
+        checksum = self._compute_checksum(payload, normalized=True)
         payload["provenance"]["checksum"] = checksum
 
         logger.debug("Serialization finished", extra={"checksum": checksum})
@@ -68,34 +144,15 @@ class DeterministicSerializer:
             "is_submodule": file.is_submodule,
         }
 
-        if file.rename_score is not None:
-            file_data["rename_score"] = file.rename_score
-
-        if file.rename_tiebreaker is not None:
-            file_data["rename_tiebreaker"] = file.rename_tiebreaker
-
-        if file.eol_only_change:
-            file_data["eol_only_change"] = True
-
-        if file.whitespace_only_change:
-            file_data["whitespace_only_change"] = True
-
-        if file.summarized:
-            file_data["summarized"] = True
-
-        if file.truncated:
-            file_data["truncated"] = True
-
-        if file.omitted_hunks_count is not None and file.omitted_hunks_count > 0:
-            file_data["omitted_hunks_count"] = file.omitted_hunks_count
-
-        if file.submodule:
-            file_data["submodule"] = file.submodule
+        for name, include in _OPTIONAL_FILE_FIELDS:
+            value = getattr(file, name)
+            if include(value):
+                file_data[name] = value
 
         if file.hunks:
-            hunks_data = []
-            for hunk in file.hunks:
-                hunk_data = {
+            # Sorting is stable, so hunks with equal starts keep their input order
+            file_data["hunks"] = [
+                {
                     "header": hunk.header,
                     "old_start": hunk.old_start,
                     "old_lines": hunk.old_lines,
@@ -105,27 +162,37 @@ class DeterministicSerializer:
                     "deleted": hunk.deleted,
                     "patch": hunk.patch,
                 }
-                hunks_data.append(hunk_data)
-
-            hunks_data.sort(key=lambda h: (h["old_start"], h["new_start"]))
-            file_data["hunks"] = hunks_data
+                for hunk in sorted(file.hunks, key=_HUNK_SORT_KEY)
+            ]
 
         return file_data
 
-    def _file_sort_key(self, file_data: Dict[str, Any]) -> tuple:
+    @staticmethod
+    def _file_sort_key(file_data: Dict[str, Any]) -> tuple:
         """Generate sort key for file ordering."""
-        effective_path = file_data.get("path_new") or file_data.get("path_old") or ""
-        status = file_data.get("status", "")
-        return (effective_path, status)
+        return _path_status_key(
+            file_data.get("path_new"),
+            file_data.get("path_old"),
+            file_data.get("status", ""),
+        )
+
+    @classmethod
+    def _normalize_structure(cls, obj: Any, *, strip_checksum: bool = False) -> Any:
+        """Return a copy of the object with deterministic ordering applied.
 
-    def _normalize_structure(self, obj: Any) -> Any:
-        """Return a copy of the object with deterministic ordering applied."""
+        With ``strip_checksum=True`` the copy also leaves out any provenance
+        checksum, so a payload can be prepared for hashing in a single pass.
+        """
         if isinstance(obj, dict):
             normalized: Dict[str, Any] = {}
             for key, value in obj.items():
-                normalized_value = self._normalize_structure(value)
+                if strip_checksum and key == "provenance" and isinstance(value, dict):
+                    value = {k: v for k, v in value.items() if k != "checksum"}
+                normalized_value = cls._normalize_structure(
+                    value, strip_checksum=strip_checksum
+                )
                 if key == "files" and isinstance(normalized_value, list):
-                    normalized_value = sorted(normalized_value, key=self._file_sort_key)
+                    normalized_value = sorted(normalized_value, key=cls._file_sort_key)
                 elif key == "hunks" and isinstance(normalized_value, list):
                     normalized_value = sorted(
                         normalized_value,
@@ -136,39 +203,63 @@ class DeterministicSerializer:
                 normalized[key] = normalized_value
             return normalized
         if isinstance(obj, list):
-            return [self._normalize_structure(item) for item in obj]
+            return [
+                cls._normalize_structure(item, strip_checksum=strip_checksum)
+                for item in obj
+            ]
         return obj
 
-    def _compute_checksum(self, payload: Dict[str, Any]) -> str:
-        """Compute SHA-256 checksum of the payload."""
-        payload_copy = self._deep_copy_without_checksum(payload)
-        normalized = self._normalize_structure(payload_copy)
-        json_bytes = self._to_deterministic_json_bytes(normalized, normalize=False)
-        checksum = hashlib.sha256(json_bytes).hexdigest()
+    def _compute_checksum(
+        self, payload: Dict[str, Any], *, normalized: bool = False
+    ) -> str:
+        """Compute the configured checksum of the payload.
+
+        Pass ``normalized=True`` for a payload that is already in deterministic
+        order and carries no checksum, so it is hashed without being copied.
+        """
+        if not normalized:
+            payload = self._normalize_structure(payload, strip_checksum=True)
+        json_bytes = self._to_deterministic_json_bytes(payload, normalize=False)
+        checksum = _checksum_text(
+            json_bytes, self.config.checksum_algo, self.config.checksum_encoding
+        )
         logger.debug("Computed payload checksum", extra={"checksum": checksum})
         return checksum
 
-    def _deep_copy_without_checksum(self, obj: Any) -> Any:
-        """Deep copy object, removing checksum field from provenance."""
-        if isinstance(obj, dict):
-            result = {}
-            for key, value in obj.items():
-                if key == "provenance":
-                    provenance_copy = {}
-                    for pkey, pvalue in value.items():
-                        if pkey != "checksum":
-                            provenance_copy[pkey] = self._deep_copy_without_checksum(pvalue)
-                    result[key] = provenance_copy
-                else:
-                    result[key] = self._deep_copy_without_checksum(value)
-            return result
-        if isinstance(obj, list):
-            return [self._deep_copy_without_checksum(item) for item in obj]
-        return obj
-
-    def _to_deterministic_json_bytes(self, obj: Any, *, normalize: bool = True) -> bytes:
+    @classmethod
+    def verify_checksum(cls, payload: Dict[str, Any]) -> bool:
+        """Check a payload's provenance checksum against its contents.
+
+        The algorithm and encoding are read from provenance; when absent the
+        payload used the defaults (sha256, hex). Both encodings are accepted.
+        """
+        provenance = payload.get("provenance") or {}
+        expected = provenance.get("checksum")
+        algo = provenance.get("checksum_algo", "sha256")
+        encoding = provenance.get("checksum_encoding", "hex")
+        if (
+            not isinstance(expected, str)
+            or algo not in _CHECKSUM_HASHERS
+            or encoding not in _CHECKSUM_ENCODERS
+        ):
+            return False
+
+        normalized = cls._normalize_structure(payload, strip_checksum=True)
+        json_bytes = cls._to_deterministic_json_bytes(normalized, normalize=False)
+        return _checksum_text(json_bytes, algo, encoding) == expected
+
+    @classmethod
+    def _to_deterministic_json_bytes(cls, obj: Any, *, normalize: bool = True) -> bytes:
         """Convert object to deterministic JSON bytes."""
-        data = self._normalize_structure(obj) if normalize else obj
+        data = cls._normalize_structure(obj) if normalize else obj
+        if orjson is not None:
+            try:
+                # Byte-identical to the stdlib encoding below for valid input
+                return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+            except orjson.JSONEncodeError:
+                # Lone surrogates and integers beyond 64 bits need the stdlib path
+                pass
+
         json_str = json.dumps(
             data,
             ensure_ascii=False,
@@ -189,13 +280,15 @@ class DeterministicSerializer:
             indent=2,
         )
 
-    def create_success_envelope(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def create_success_envelope(payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create success envelope around payload."""
         logger.debug("Creating success envelope")
         return {"ok": True, "data": payload}
 
+    @staticmethod
     def create_error_envelope(
-        self, error_code: str, error_message: str, details: Dict[str, Any] = None
+        error_code: str, error_message: str, details: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """Create error envelope."""
         logger.debug("Creating error envelope", extra={"code": error_code})
@@ -24,3 +24,18 @@ def get_git_credentials() -> tuple[Optional[str], Optional[str]]:
 
     logger.debug("Git credentials not configured")
     return None, None
+
+
+def get_diff_cache_size(default: int = 32) -> int:
+    """Return the number of diff payloads to memoize per process (0 disables)."""
+    raw_value = os.getenv("DIFF_CACHE_SIZE")
+    if raw_value is None:
+        return default
+
+    try:
+        cache_size = int(raw_value)
+    except ValueError:
+        logger.warning("Ignoring invalid DIFF_CACHE_SIZE", extra={"value": raw_value})
+        return default
+
+    return max(cache_size, 0)
@@ -8,7 +8,7 @@ import subprocess
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse, urlunparse
 
 from .config import DiffConfig
@@ -23,6 +23,38 @@ from .settings import get_git_credentials
 
 logger = logging.getLogger(__name__)
 
+# Tree entry mode git uses for submodules (gitlinks)
+GITLINK_MODE = "160000"
+# Mode reported by `git diff --raw` for the missing side of an add/delete
+NULL_MODE = "000000"
+# Start of each per-file section in `git diff` output
+_DIFF_SECTION_PATTERN = re.compile(rb"^diff --git ", re.MULTILINE)
+# C-style escapes git uses when quoting paths in diff headers
+_QUOTED_ESCAPE_PATTERN = re.compile(rb"\\([0-7]{3}|.)", re.DOTALL)
+_QUOTED_ESCAPES = {
+    b"a": b"\a",
+    b"b": b"\b",
+    b"t": b"\t",
+    b"n": b"\n",
+    b"v": b"\v",
+    b"f": b"\f",
+    b"r": b"\r",
+}
+
+
+def _unquote_path(path: bytes) -> bytes:
+    """Undo git's C-style quoting of a path from diff output."""
+    if len(path) < 2 or not (path.startswith(b'"') and path.endswith(b'"')):
+        return path
+
+    def _unescape(match: "re.Match[bytes]") -> bytes:
+        escape = match.group(1)
+        if len(escape) == 3:
+            return bytes([int(escape, 8)])
+        return _QUOTED_ESCAPES.get(escape, escape)
+
+    return _QUOTED_ESCAPE_PATTERN.sub(_unescape, path[1:-1])
+
 
 @dataclass
 class FileChange:
@@ -50,7 +82,19 @@ class GitRepository:
         """Initialize with configuration."""
         self.config = config
         self.workdir: Optional[Path] = None
+        # git_env copies os.environ on every access; build it once per repository
+        self._env: Dict[str, str] = config.git_env
         self._git_version: Optional[str] = None
+        self._binary_paths: Set[str] = set()
+        self._diff_buf: Optional[bytes] = None
+        self._diff_offsets: Dict[str, Tuple[int, int]] = {}
+        self._git_base_cmd: Tuple[str, ...] = (
+            "git",
+            "-c",
+            "core.autocrlf=false",
+            "-c",
+            "color.ui=false",
+        )
 
     def __enter__(self) -> "GitRepository":
         """Context manager entry."""
@@ -71,15 +115,14 @@ class GitRepository:
         timeout: int = 300,
         check: bool = True,
         capture_output: bool = True,
+        binary: bool = False,
     ) -> subprocess.CompletedProcess:
-        """Run git command with proper environment and error handling."""
-        cmd = [
-            "git",
-            "-c",
-            "core.autocrlf=false",
-            "-c",
-            "color.ui=false",
-        ] + args
+        """Run git command with proper environment and error handling.
+
+        With ``binary=True`` stdout is returned as undecoded bytes so callers
+        can decode only the fields they need.
+        """
+        cmd = [*self._git_base_cmd, *args]
 
         safe_args: List[str] = []
         for arg in cmd:
@@ -97,11 +140,11 @@ class GitRepository:
             result = subprocess.run(
                 cmd,
                 cwd=self.workdir,
-                env=self.config.git_env,
+                env=self._env,
                 timeout=timeout,
                 check=check,
                 capture_output=capture_output,
-                text=True,
+                text=not binary,
             )
             logger.debug(
                 "Git command completed",
@@ -204,16 +247,9 @@ class GitRepository:
 
         try:
             result = subprocess.run(
-                [
-                    "git",
-                    "-c",
-                    "core.autocrlf=false",
-                    "-c",
-                    "color.ui=false",
-                ]
-                + clone_args,
+                [*self._git_base_cmd, *clone_args],
                 cwd=self.workdir,
-                env=self.config.git_env,
+                env=self._env,
                 timeout=300,
                 check=True,
                 capture_output=True,
@@ -268,30 +304,51 @@ class GitRepository:
 
     def get_file_changes(self) -> List[FileChange]:
         """Get list of file changes between commits with rename detection."""
-        # Use git diff with rename detection
+        # Use git diff with rename detection; --raw carries both modes and
+        # object SHAs so submodules need no per-file lookups
         diff_args = [
             "diff",
-            "--name-status",
+            "--raw",
+            "-z",
+            "--no-abbrev",
             "--find-renames=" + str(self.config.find_renames_threshold),
             "--no-color",
             f"{self.config.commit_good}..{self.config.commit_candidate}",
         ]
 
-        result = self._run_git(diff_args)
+        self._binary_paths = self._load_binary_paths()
+        result = self._run_git(diff_args, binary=True)
         changes = []
-        logger.info(
-            "Parsed file changes",
-            extra={"repo": self.config.repo_url, "raw_lines": len(result.stdout.strip().split("\n"))},
-        )
 
-        for line in result.stdout.strip().split("\n"):
-            if not line:
+        # Records are ":<meta>\0<path>\0", with a second path for renames/copies
+        fields = result.stdout.split(b"\0")
+        index = 0
+        while index < len(fields):
+            meta = fields[index]
+            index += 1
+            if not meta.startswith(b":"):
+                continue
+
+            raw_meta = meta[1:].decode("ascii").split()
+            if len(raw_meta) < 5:
                 continue
 
-            change = self._parse_diff_line(line)
+            path_count = 2 if raw_meta[4][:1] in ("R", "C") else 1
+            paths = [
+                field.decode("utf-8", "surrogateescape")
+                for field in fields[index : index + path_count]
+            ]
+            index += path_count
+
+            change = self._build_file_change(raw_meta[4], paths, raw_meta)
             if change:
                 changes.append(change)
 
+        logger.info(
+            "Parsed file changes",
+            extra={"repo": self.config.repo_url, "changes": len(changes)},
+        )
+
         # Sort changes deterministically
         changes.sort(key=self._change_sort_key)
 
@@ -300,6 +357,39 @@ class GitRepository:
 
         return changes
 
+    def _load_binary_paths(self) -> Set[str]:
+        """Collect paths git reports as binary using a single numstat scan."""
+        result = self._run_git([
+            "diff",
+            "--numstat",
+            "-z",
+            "--find-renames=" + str(self.config.find_renames_threshold),
+            "--no-color",
+            f"{self.config.commit_good}..{self.config.commit_candidate}",
+        ], binary=True)
+
+        binary_paths: Set[str] = set()
+        records = iter(result.stdout.split(b"\0"))
+        for record in records:
+            parts = record.split(b"\t", 2)
+            if len(parts) < 3:
+                continue
+
+            added, deleted, path = parts
+            if path:
+                paths = [path]
+            else:
+                # Renames/copies: "<added>\t<deleted>\t\0<old>\0<new>\0"
+                paths = [next(records, b""), next(records, b"")]
+
+            # Binary shows as "-\t-\t<path>"
+            if added == b"-" and deleted == b"-":
+                binary_paths.update(
+                    p.decode("utf-8", "surrogateescape") for p in paths if p
+                )
+
+        return binary_paths
+
     def _parse_diff_line(self, line: str) -> Optional[FileChange]:
         """Parse a single line from git diff --name-status output."""
         # Handle quoted filenames (git uses C-style quoting for special chars)
@@ -320,7 +410,18 @@ class GitRepository:
         if len(parts) < 2:
             return None
 
-        status_part = parts[0]
+        return self._build_file_change(parts[0], parts[1:])
+
+    def _build_file_change(
+        self,
+        status_part: str,
+        paths: List[str],
+        raw_meta: Optional[List[str]] = None,
+    ) -> Optional[FileChange]:
+        """Build a FileChange from a status field, paths and optional raw metadata."""
+        if not status_part or not paths:
+            return None
+
         status = status_part[0]
 
         # Handle rename/copy with score
@@ -333,31 +434,48 @@ class GitRepository:
         # Extract paths
         if status in "RC":
             # Rename/copy: old_path -> new_path
-            if len(parts) >= 3:
-                path_old, path_new = parts[1], parts[2]
+            if len(paths) >= 2:
+                path_old, path_new = paths[0], paths[1]
             else:
                 return None
         elif status == "D":
             # Delete: only old path
-            path_old, path_new = parts[1], None
+            path_old, path_new = paths[0], None
         else:
             # Add/Modify: only new path
-            path_old, path_new = None, parts[1]
-
-        # Get file metadata
-        mode_old, mode_new, size_old, size_new = self._get_file_metadata(
-            path_old, path_new
-        )
-
-        # Check if binary or submodule
-        is_binary, is_submodule = self._check_file_type(path_old, path_new)
-
-        # Get submodule SHAs if applicable
-        submodule_old_sha, submodule_new_sha = None, None
-        if is_submodule:
-            submodule_old_sha, submodule_new_sha = self._get_submodule_shas(
-                path_old, path_new
-            )
+            path_old, path_new = None, paths[0]
+
+        # Get file metadata; raw output already carries the modes, so only
+        # blob sizes need a tree lookup
+        object_old: Optional[str]
+        object_new: Optional[str]
+        if raw_meta:
+            mode_old = None if raw_meta[0] == NULL_MODE else raw_meta[0]
+            mode_new = None if raw_meta[1] == NULL_MODE else raw_meta[1]
+            is_submodule = GITLINK_MODE in (mode_old, mode_new)
+            size_old, size_new = None, None
+            object_old, object_new = raw_meta[2], raw_meta[3]
+            if not is_submodule:
+                _, _, size_old, size_new, _, _ = self._get_file_metadata(
+                    path_old, path_new
+                )
+        else:
+            (
+                mode_old,
+                mode_new,
+                size_old,
+                size_new,
+                object_old,
+                object_new,
+            ) = self._get_file_metadata(path_old, path_new)
+            is_submodule = GITLINK_MODE in (mode_old, mode_new)
+
+        # Binary status comes from the batched numstat scan
+        is_binary = not is_submodule and (path_new or path_old) in self._binary_paths
+
+        # Gitlink entries name the submodule commit directly
+        submodule_old_sha = object_old if mode_old == GITLINK_MODE else None
+        submodule_new_sha = object_new if mode_new == GITLINK_MODE else None
 
         return FileChange(
             status=status,
@@ -377,10 +495,18 @@ class GitRepository:
 
     def _get_file_metadata(
         self, path_old: Optional[str], path_new: Optional[str]
-    ) -> Tuple[Optional[str], Optional[str], Optional[int], Optional[int]]:
-        """Get file mode and size metadata."""
+    ) -> Tuple[
+        Optional[str],
+        Optional[str],
+        Optional[int],
+        Optional[int],
+        Optional[str],
+        Optional[str],
+    ]:
+        """Get file mode, size and object id metadata from the commit trees."""
         mode_old, mode_new = None, None
         size_old, size_new = None, None
+        object_old, object_new = None, None
 
         # Get old file metadata
         if path_old:
@@ -397,12 +523,11 @@ class GitRepository:
                     meta_and_path = output.split("\t", 1)
                     meta_parts = meta_and_path[0].split()
                     if len(meta_parts) >= 3:
-                        mode_old = meta_parts[0]
+                        mode_old, object_old = meta_parts[0], meta_parts[2]
                         if len(meta_parts) >= 4 and meta_parts[1] != "commit":
-                            try:
-                                size_old = int(meta_parts[3])
-                            except ValueError:
-                                size_old = None
+                            # Tree entries report "-" instead of a size
+                            size_field = meta_parts[3]
+                            size_old = int(size_field) if size_field.isdigit() else None
             except subprocess.CalledProcessError:
                 pass
 
@@ -420,101 +545,15 @@ class GitRepository:
                     meta_and_path = output.split("\t", 1)
                     meta_parts = meta_and_path[0].split()
                     if len(meta_parts) >= 3:
-                        mode_new = meta_parts[0]
+                        mode_new, object_new = meta_parts[0], meta_parts[2]
                         if len(meta_parts) >= 4 and meta_parts[1] != "commit":
-                            try:
-                                size_new = int(meta_parts[3])
-                            except ValueError:
-                                size_new = None
+                            # Tree entries report "-" instead of a size
+                            size_field = meta_parts[3]
+                            size_new = int(size_field) if size_field.isdigit() else None
             except subprocess.CalledProcessError:
                 pass
 
-        return mode_old, mode_new, size_old, size_new
-
-    def _check_file_type(
-        self, path_old: Optional[str], path_new: Optional[str]
-    ) -> Tuple[bool, bool]:
-        """Check if file is binary or submodule."""
-        is_binary = False
-        is_submodule = False
-
-        # Check the new file (or old if deleted)
-        check_path = path_new or path_old
-        if not check_path:
-            return False, False
-
-        commit = (
-            self.config.commit_candidate
-            if path_new
-            else self.config.commit_good
-        )
-
-        try:
-            # Check if it's a submodule (gitlink)
-            result = self._run_git(["ls-tree", commit, check_path])
-            if result.stdout.strip():
-                parts = result.stdout.strip().split()
-                if len(parts) >= 2 and parts[1] == "commit":
-                    is_submodule = True
-                    return is_binary, is_submodule
-
-            # Check if binary using git's detection (single invocation)
-            try:
-                result = self._run_git([
-                    "diff",
-                    "--numstat",
-                    f"{self.config.commit_good}..{self.config.commit_candidate}",
-                    "--",
-                    check_path,
-                ])
-                if result.stdout.strip():
-                    first = result.stdout.strip().split("\n")[0]
-                    # Binary shows as "-\t-\t<path>"
-                    if first.startswith("-\t-\t"):
-                        is_binary = True
-            except subprocess.CalledProcessError:
-                pass
-
-        except subprocess.CalledProcessError:
-            pass
-
-        return is_binary, is_submodule
-
-    def _get_submodule_shas(
-        self, path_old: Optional[str], path_new: Optional[str]
-    ) -> Tuple[Optional[str], Optional[str]]:
-        """Get submodule SHA values."""
-        old_sha, new_sha = None, None
-
-        if path_old:
-            try:
-                result = self._run_git([
-                    "ls-tree",
-                    self.config.commit_good,
-                    path_old,
-                ])
-                if result.stdout.strip():
-                    parts = result.stdout.strip().split()
-                    if len(parts) >= 3:
-                        old_sha = parts[2]
-            except subprocess.CalledProcessError:
-                pass
-
-        if path_new:
-            try:
-                result = self._run_git([
-                    "ls-tree",
-                    self.config.commit_candidate,
-                    path_new,
-                ])
-                if result.stdout.strip():
-                    parts = result.stdout.strip().split()
-                    if len(parts) >= 3:
-                        new_sha = parts[2]
-            except subprocess.CalledProcessError:
-                pass
-
-        return old_sha, new_sha
+        return mode_old, mode_new, size_old, size_new, object_old, object_new
 
     def _change_sort_key(self, change: FileChange) -> Tuple[str, str]:
         """Generate sort key for deterministic ordering."""
@@ -579,27 +618,77 @@ class GitRepository:
         if change.is_binary or change.is_submodule:
             return ""
 
+        path = change.path_new or change.path_old
+        if not path:
+            return ""
+
+        diff_buf = self._diff_buf
+        if diff_buf is None:
+            diff_buf = self._load_unified_diffs()
+
+        span = self._diff_offsets.get(path)
+        if span is None:
+            return ""
+
+        start, end = span
+        return diff_buf[start:end].decode("utf-8", "replace")
+
+    def _load_unified_diffs(self) -> bytes:
+        """Load unified diffs for all changes with a single git invocation."""
         diff_args = [
             "diff",
             f"--unified={self.config.context_lines}",
             "--no-color",
             "--no-prefix",
+            "--find-renames=" + str(self.config.find_renames_threshold),
             f"{self.config.commit_good}..{self.config.commit_candidate}",
-            "--",
         ]
 
-        # Add the appropriate path
-        if change.path_new:
-            diff_args.append(change.path_new)
-        elif change.path_old:
-            diff_args.append(change.path_old)
-        else:
-            return ""
-
-        try:
-            result = self._run_git(diff_args, check=False)
-            return result.stdout
-        except subprocess.CalledProcessError:
-            return ""
+        result = self._run_git(diff_args, check=False, binary=True)
+        diff_buf = result.stdout or b""
 
+        # Record (start, end) offsets of each per-file section in the buffer
+        starts = [match.start() for match in _DIFF_SECTION_PATTERN.finditer(diff_buf)]
+        starts.append(len(diff_buf))
+        offsets: Dict[str, Tuple[int, int]] = {}
+        for start, end in zip(starts, starts[1:]):
+            path = self._section_path(diff_buf, start, end)
+            if not path:
+                continue
+            if path in offsets:
+                # A type change emits adjacent delete and add sections for the
+                # same path; keep both halves
+                start = offsets[path][0]
+            offsets[path] = (start, end)
 
+        logger.debug(
+            "Loaded unified diffs",
+            extra={"bytes": len(diff_buf), "sections": len(offsets)},
+        )
+        self._diff_buf = diff_buf
+        self._diff_offsets = offsets
+        return diff_buf
+
+    def _section_path(self, diff_buf: bytes, start: int, end: int) -> Optional[str]:
+        """Return the effective path of a `diff --git` section."""
+        header_end = diff_buf.find(b"\n", start, end)
+        if header_end == -1:
+            header_end = end
+
+        # Renames and copies name their destination in the extended header
+        hunks_start = diff_buf.find(b"\n@@", header_end, end)
+        limit = hunks_start if hunks_start != -1 else end
+        for marker in (b"\nrename to ", b"\ncopy to "):
+            pos = diff_buf.find(marker, header_end, limit)
+            if pos != -1:
+                value_start = pos + len(marker)
+                value_end = diff_buf.find(b"\n", value_start, end)
+                path = diff_buf[value_start : value_end if value_end != -1 else end]
+                return _unquote_path(path).decode("utf-8", "surrogateescape")
+
+        # Otherwise the header is "diff --git <path> <path>" with both sides equal
+        paths = diff_buf[start + len(b"diff --git ") : header_end]
+        half = len(paths) // 2
+        if paths[half : half + 1] == b" " and paths[:half] == paths[half + 1 :]:
+            return _unquote_path(paths[:half]).decode("utf-8", "surrogateescape")
+        return None
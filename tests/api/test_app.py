@@ -3,7 +3,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from p1diff.api.app import app
+from p1diff.api.app import FastJSONResponse, app
 
 
 @pytest.fixture
@@ -73,7 +73,28 @@ class TestAPIEndpoints:
             "cap_file": 2000
         })
         assert response.status_code == 422
+
+        # Test unsupported checksum algorithm
+        response = client.post("/diff", json={
+            "repo_url": "https://github.com/user/repo.git",
+            "commit_good": "abc1234",
+            "commit_candidate": "def4567",
+            "checksum_algo": "md5"
+        })
+        assert response.status_code == 422
+
+        # Test unsupported checksum encoding
+        response = client.post("/diff", json={
+            "repo_url": "https://github.com/user/repo.git",
+            "commit_good": "abc1234",
+            "commit_candidate": "def4567",
+            "checksum_encoding": "base32"
+        })
+        assert response.status_code == 422
     
+    @pytest.mark.integration
+    @pytest.mark.network
+    @pytest.mark.slow
     def test_diff_endpoint_valid_request_structure(self, client):
         """Test that diff endpoint accepts valid request structure."""
         # This test validates the request structure without actually processing
@@ -110,3 +131,17 @@ class TestAPIEndpoints:
             assert "error" in data
             assert "code" in data["error"]
             assert "message" in data["error"]
+
+
+class TestFastJSONResponse:
+    """Test FastJSONResponse class."""
+
+    def test_render_matches_stdlib_encoding(self):
+        """Test rendering is compact UTF-8 JSON, including values orjson rejects."""
+        content = {"path": "café.txt", "ok": True, "size": 2**70}
+        response = FastJSONResponse(content)
+
+        assert response.body == (
+            b'{"path":"caf\xc3\xa9.txt","ok":true,"size":1180591620717411303424}'
+        )
+        assert response.headers["content-type"] == "application/json"
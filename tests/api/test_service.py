@@ -0,0 +1,75 @@
+"""Tests for the API service layer."""
+
+from p1diff.api.services import DiffService
+from p1diff.api.services.diff import cached_compute_diff
+
+
+class TestDiffService:
+    """Test DiffService against a local repository."""
+
+    def test_repeated_request_served_from_cache(self, git_helper):
+        """Test identical requests reuse the memoized payload."""
+        git_helper.create_file("app.py", "print('v1')\n")
+        commit_good = git_helper.add_and_commit("Add app")
+        git_helper.modify_file("app.py", "print('v2')\n")
+        commit_candidate = git_helper.add_and_commit("Update app")
+
+        cached_compute_diff.cache_clear()
+        service = DiffService()
+        request = {
+            "repo_url": str(git_helper.repo_path),
+            "commit_good": commit_good,
+            "commit_candidate": commit_candidate,
+        }
+
+        first = service.process_diff_request(**request)
+        second = service.process_diff_request(**request)
+
+        assert first["ok"] is True
+        assert [f["path_new"] for f in first["data"]["files"]] == ["app.py"]
+        assert second["data"] is first["data"]
+        assert cached_compute_diff.cache_info().hits == 1
+
+    def test_failed_request_not_cached(self, tmp_path):
+        """Test failures surface as error envelopes and are not memoized."""
+        cached_compute_diff.cache_clear()
+        service = DiffService()
+
+        result = service.process_diff_request(
+            repo_url=str(tmp_path / "missing"),
+            commit_good="a" * 40,
+            commit_candidate="b" * 40,
+        )
+
+        assert result["ok"] is False
+        assert result["error"]["code"] == "CLONE_FAILED"
+        assert cached_compute_diff.cache_info().currsize == 0
+
+    def test_moving_ref_not_served_stale(self, git_helper):
+        """Test requests naming a ref see where it points at request time."""
+        git_helper.create_file("app.py", "print('v1')\n")
+        commit_good = git_helper.add_and_commit("Add app")
+        git_helper.modify_file("app.py", "print('v2')\n")
+        commit_v2 = git_helper.add_and_commit("Update app")
+        git_helper.run_git(["tag", "release-1", commit_v2])
+
+        cached_compute_diff.cache_clear()
+        service = DiffService()
+        request = {
+            "repo_url": str(git_helper.repo_path),
+            "commit_good": commit_good,
+            "commit_candidate": "release-1",
+        }
+
+        first = service.process_diff_request(**request)
+
+        git_helper.modify_file("app.py", "print('v3')\n")
+        commit_v3 = git_helper.add_and_commit("Update app again")
+        git_helper.run_git(["tag", "-f", "release-1", commit_v3])
+
+        second = service.process_diff_request(**request)
+
+        assert first["ok"] is True and second["ok"] is True
+        assert "+print('v2')" in first["data"]["files"][0]["hunks"][0]["patch"]
+        assert "+print('v3')" in second["data"]["files"][0]["hunks"][0]["patch"]
+        assert cached_compute_diff.cache_info().currsize == 0
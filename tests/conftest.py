@@ -3,28 +3,56 @@
 import os
 import shutil
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import Generator, List
+from typing import Generator, List, Optional
 
 import pytest
 
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - optional speedup for test setup
+    pygit2 = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' that reach remote hosts",
+    )
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    temp_path = Path(tempfile.mkdtemp(prefix="p1diff_test_"))
-    try:
-        yield temp_path
-    finally:
-        if temp_path.exists():
-            shutil.rmtree(temp_path, ignore_errors=True)
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Skip network tests unless explicitly enabled."""
+    if config.getoption("--run-network") or os.environ.get("P1DIFF_RUN_NETWORK") == "1":
+        return
+
+    skip_network = pytest.mark.skip(
+        reason="needs network access (use --run-network or P1DIFF_RUN_NETWORK=1)"
+    )
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
 
 
 @pytest.fixture
-def git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary git repository for testing."""
-    repo_path = temp_dir / "test_repo"
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory for tests.
+
+    Directories live under pytest's session base directory, which pytest prunes
+    itself, so tests do not pay for an rmtree each.
+    """
+    return tmp_path_factory.mktemp("p1diff_test_")
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a git repository with an initial commit once per test session."""
+    repo_path = tmp_path_factory.mktemp("git_template") / "test_repo"
     repo_path.mkdir()
 
     # Initialize git repo
@@ -43,7 +71,6 @@ def git_repo(temp_dir: Path) -> Generator[Path, None, None]:
             env=env,
             check=True,
             capture_output=True,
-            text=True,
         )
 
     # Initialize repository
@@ -56,6 +83,18 @@ def git_repo(temp_dir: Path) -> Generator[Path, None, None]:
     run_git(["add", "README.md"])
     run_git(["commit", "-m", "Initial commit"])
 
+    return repo_path
+
+
+@pytest.fixture
+def git_repo(temp_dir: Path, git_repo_template: Path) -> Generator[Path, None, None]:
+    """Create a temporary git repository for testing."""
+    repo_path = temp_dir / "test_repo"
+
+    # Copy the session template so each test gets its own mutable repository
+    # without re-running git init and the initial commit
+    shutil.copytree(git_repo_template, repo_path, symlinks=True)
+
     yield repo_path
 
 
@@ -71,16 +110,19 @@ class GitRepoHelper:
             "GIT_COMMITTER_NAME": "Test User",
             "GIT_COMMITTER_EMAIL": "test@example.com",
         })
+        self._head_sha: Optional[str] = None
 
     def run_git(self, args: List[str]) -> subprocess.CompletedProcess:
-        """Run git command in the repository."""
+        """Run git command in the repository, capturing output as bytes."""
+        if args[:1] != ["rev-parse"]:
+            # Any other command may move HEAD
+            self._head_sha = None
         return subprocess.run(
             ["git"] + args,
             cwd=self.repo_path,
             env=self.env,
             check=True,
             capture_output=True,
-            text=True,
         )
 
     def create_file(self, path: str, content: str) -> None:
@@ -101,6 +143,9 @@ class GitRepoHelper:
 
     def add_and_commit(self, message: str, files: List[str] = None) -> str:
         """Add files and create a commit, return commit SHA."""
+        if pygit2 is not None:
+            return self._commit_in_process(message, files)
+
         if files:
             for file in files:
                 self.run_git(["add", file])
@@ -108,13 +153,34 @@ class GitRepoHelper:
             self.run_git(["add", "-A"])
 
         self.run_git(["commit", "-m", message])
-        result = self.run_git(["rev-parse", "HEAD"])
-        return result.stdout.strip()
+        return self.get_current_sha()
+
+    def _commit_in_process(self, message: str, files: Optional[List[str]]) -> str:
+        """Stage and commit through libgit2 without spawning git."""
+        repo = pygit2.Repository(str(self.repo_path))
+        index = repo.index
+        if files:
+            for file in files:
+                index.add(file)
+        else:
+            # Like "git add -A", this also drops deleted files from the index
+            index.add_all()
+        index.write()
+
+        signature = pygit2.Signature("Test User", "test@example.com")
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        commit_id = repo.create_commit(
+            "HEAD", signature, signature, message, index.write_tree(), parents
+        )
+        self._head_sha = str(commit_id)
+        return self._head_sha
 
     def get_current_sha(self) -> str:
-        """Get current commit SHA."""
-        result = self.run_git(["rev-parse", "HEAD"])
-        return result.stdout.strip()
+        """Get current commit SHA, cached until the next mutating git command."""
+        if self._head_sha is None:
+            result = self.run_git(["rev-parse", "HEAD"])
+            self._head_sha = result.stdout.decode("ascii").strip()
+        return self._head_sha
 
     def create_binary_file(self, path: str) -> None:
         """Create a binary file."""
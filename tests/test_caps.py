@@ -270,6 +270,8 @@ class TestCapacityManager:
         assert processed_file.omitted_hunks_count is not None
         assert processed_file.omitted_hunks_count > 0
         assert len(processed_file.hunks) < len(hunks)  # Some hunks should be removed
+        assert manager.stats["truncated_files"] == 1
+        assert manager.stats["summarized_files"] == 0
 
     def test_apply_caps_lockfile_summarized(self):
         """Test that lockfiles are summarized when oversized."""
@@ -314,6 +316,8 @@ class TestCapacityManager:
         assert processed_file.summarized is True
         assert processed_file.truncated is False
         assert len(processed_file.hunks) == 0  # Hunks should be removed
+        assert manager.stats["summarized_files"] == 1
+        assert manager.stats["truncated_files"] == 0
 
     def test_truncate_hunk_context(self):
         """Test hunk context truncation."""
@@ -353,3 +357,44 @@ class TestCapacityManager:
             assert len(truncated_hunk.patch) < len(patch)
             assert "-old line" in truncated_hunk.patch
             assert "+new line" in truncated_hunk.patch
+
+    def test_apply_caps_global_budget_in_input_order(self):
+        """Test the global cap admits files in order, skipping only overflowing ones."""
+        config = DiffConfig("repo", "good", "cand", cap_total=100, cap_file=100)
+        manager = CapacityManager(config)
+
+        def make_file(path, patch_size):
+            patch = "@@ -1,1 +1,1 @@\n" + "+" * (patch_size - len("@@ -1,1 +1,1 @@\n"))
+            hunk = DiffHunk(
+                header="@@ -1,1 +1,1 @@",
+                old_start=1,
+                old_lines=1,
+                new_start=1,
+                new_lines=1,
+                added=1,
+                deleted=0,
+                patch=patch,
+            )
+            return ProcessedFile(
+                status="M",
+                path_old=path,
+                path_new=path,
+                rename_score=None,
+                rename_tiebreaker=None,
+                mode_old="100644",
+                mode_new="100644",
+                size_old=100,
+                size_new=100,
+                is_binary=False,
+                is_submodule=False,
+                hunks=[hunk],
+            )
+
+        files = [make_file("a.py", 60), make_file("b.py", 60), make_file("c.py", 30)]
+        processed_files, omitted_count = manager.apply_caps(files)
+
+        assert [f.path_new for f in processed_files] == ["a.py", "b.py", "c.py"]
+        assert [len(f.hunks) for f in processed_files] == [1, 0, 1]
+        assert processed_files[1].omitted_hunks_count == 1
+        assert omitted_count == 1
+        assert manager.total_bytes_used == 90
@@ -106,6 +106,26 @@ class TestDiffConfig:
                 find_renames_threshold=150,
             )
 
+    def test_invalid_checksum_algo(self):
+        """Test validation of unsupported checksum algorithm."""
+        with pytest.raises(ValueError, match="checksum_algo must be one of"):
+            DiffConfig(
+                repo_url="https://example.com/repo.git",
+                commit_good="abc123",
+                commit_candidate="def456",
+                checksum_algo="md5",
+            )
+
+    def test_invalid_checksum_encoding(self):
+        """Test validation of unsupported checksum encoding."""
+        with pytest.raises(ValueError, match="checksum_encoding must be one of"):
+            DiffConfig(
+                repo_url="https://example.com/repo.git",
+                commit_good="abc123",
+                commit_candidate="def456",
+                checksum_encoding="base32",
+            )
+
     def test_git_env(self):
         """Test git environment variables."""
         import os
@@ -154,6 +174,38 @@ class TestDiffConfig:
         assert provenance["rename_detection"]["enabled"] is True
         assert provenance["rename_detection"]["threshold_pct"] == 80
         assert provenance["diff_algorithm"] == "myers"
+        assert "checksum_algo" not in provenance
+        assert "checksum_encoding" not in provenance
         assert provenance["env_locks"]["LC_ALL"] == "C"
         assert provenance["env_locks"]["color"] == "off"
         assert provenance["env_locks"]["core.autocrlf"] == "false"
+
+    def test_provenance_records_non_default_checksum_settings(self):
+        """Test non-default checksum settings are recorded in provenance."""
+        config = DiffConfig(
+            repo_url="https://example.com/repo.git",
+            commit_good="abc123",
+            commit_candidate="def456",
+            checksum_algo="blake2b",
+            checksum_encoding="b64",
+        )
+
+        provenance = config.to_provenance_dict()
+        assert provenance["checksum_algo"] == "blake2b"
+        assert provenance["checksum_encoding"] == "b64"
+
+    def test_to_provenance_dict_reuses_cached_provenance(self):
+        """Test provenance is built once and top-level copies are independent."""
+        config = DiffConfig(
+            repo_url="https://example.com/repo.git",
+            commit_good="abc123",
+            commit_candidate="def456",
+        )
+
+        first = config.to_provenance_dict()
+        first["git_version"] = "2.34.1"
+        second = config.to_provenance_dict()
+
+        assert config.provenance is config.provenance
+        assert "git_version" not in second
+        assert second["caps"] is first["caps"]
@@ -2,7 +2,13 @@
 
 import pytest
 
-from p1diff.diffpack import DiffProcessor, DiffHunk, ProcessedFile
+from p1diff.diffpack import (
+    CHANGE_EOL_ONLY,
+    CHANGE_WHITESPACE_ONLY,
+    DiffProcessor,
+    DiffHunk,
+    ProcessedFile,
+)
 from p1diff.vcs import FileChange
 
 
@@ -210,23 +216,46 @@ class TestDiffProcessor:
         is_ws_only = processor._detect_whitespace_only_change(content_diff)
         assert is_ws_only is False
 
-    def test_create_hunk_with_context(self):
-        """Test hunk creation with context lines."""
-        header = "@@ -5,7 +5,8 @@"
-        header_match = processor = DiffProcessor()
-        match = processor.hunk_header_pattern.match(header)
-        
-        lines = [
-            " context1",
-            " context2", 
-            "-removed line",
-            "+added line1",
-            "+added line2",
-            " context3",
-            " context4"
-        ]
+    @pytest.mark.parametrize("space", ["\xa0", "\u3000", "\x1c"])
+    def test_detect_whitespace_only_change_non_ascii_space(self, space):
+        """Test whitespace beyond string.whitespace still counts as whitespace."""
+        ws_diff = f"@@ -1,1 +1,1 @@\n-a{space}b\n+a b"
+
+        processor = DiffProcessor()
+        assert processor._detect_whitespace_only_change(ws_diff) is True
+
+    def test_classify_change_flags(self):
+        """Test combined classification matches the individual detectors."""
+        processor = DiffProcessor()
+
+        eol_diff = "@@ -1,1 +1,1 @@\n-line\r\n+line"
+        ws_diff = "@@ -1,1 +1,1 @@\n-a = 1\n+a  =  1"
+        content_diff = "@@ -1,1 +1,1 @@\n-old\n+new"
+
+        # A CR is whitespace too, so EOL-only changes are also whitespace-only
+        assert processor._classify_change(eol_diff) == (
+            CHANGE_EOL_ONLY | CHANGE_WHITESPACE_ONLY
+        )
+        assert processor._classify_change(ws_diff) == CHANGE_WHITESPACE_ONLY
+        assert processor._classify_change(content_diff) == 0
+
+    def test_split_into_hunks_with_context(self):
+        """Test hunk splitting keeps context lines and counts changes."""
+        unified_diff = "\n".join(
+            [
+                "@@ -5,7 +5,8 @@",
+                " context1",
+                " context2",
+                "-removed line",
+                "+added line1",
+                "+added line2",
+                " context3",
+                " context4",
+            ]
+        )
 
-        hunk = processor._create_hunk(header, match, lines)
+        processor = DiffProcessor()
+        (hunk,) = processor._split_into_hunks(unified_diff)
 
         assert hunk.header == "@@ -5,7 +5,8 @@"
         assert hunk.old_start == 5
@@ -238,3 +267,73 @@ class TestDiffProcessor:
         assert "context1" in hunk.patch
         assert "removed line" in hunk.patch
         assert "added line1" in hunk.patch
+
+
+class TestDiffHunk:
+    """Test DiffHunk class."""
+
+    def test_byte_size_counts_utf8_bytes(self):
+        """Test cached patch size is measured in UTF-8 bytes."""
+        patch = "@@ -1,1 +1,1 @@\n-café\n+naïve"
+        hunk = DiffHunk(
+            header="@@ -1,1 +1,1 @@",
+            old_start=1,
+            old_lines=1,
+            new_start=1,
+            new_lines=1,
+            added=1,
+            deleted=1,
+            patch=patch,
+        )
+
+        assert hunk.byte_size == len(patch.encode("utf-8"))
+        assert hunk.byte_size > len(patch)
+
+
+class TestProcessedFile:
+    """Test ProcessedFile class."""
+
+    def test_size_bytes_tracks_reassigned_hunks(self):
+        """Test cached file size follows reassignment of the hunks list."""
+        hunks = [
+            DiffHunk(
+                header="@@ -1,1 +1,1 @@",
+                old_start=1,
+                old_lines=1,
+                new_start=1,
+                new_lines=1,
+                added=1,
+                deleted=0,
+                patch=f"@@ -1,1 +1,1 @@\n+line {i}",
+            )
+            for i in range(3)
+        ]
+        file = ProcessedFile(
+            status="M",
+            path_old="test.py",
+            path_new="test.py",
+            rename_score=None,
+            rename_tiebreaker=None,
+            mode_old="100644",
+            mode_new="100644",
+            size_old=100,
+            size_new=100,
+            is_binary=False,
+            is_submodule=False,
+            hunks=hunks,
+        )
+
+        assert file.size_bytes == sum(h.byte_size for h in hunks)
+        assert list(file.hunk_sizes) == [h.byte_size for h in hunks]
+
+        file.hunks = hunks[:1]
+        assert file.size_bytes == hunks[0].byte_size
+
+        file.hunks = []
+        assert file.size_bytes == 0
+        # An empty hunks list is cached like any other
+        assert file._sizes() is file._sizes()
+
+        file.set_hunks(hunks)
+        assert file._size_cache is None
+        assert file.size_bytes == sum(h.byte_size for h in hunks)
@@ -8,112 +8,154 @@ from p1diff.policies import FilePolicies
 class TestFilePolicies:
     """Test FilePolicies class."""
 
-    def test_is_lockfile(self):
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            # JavaScript/Node.js lockfiles
+            ("package-lock.json", True),
+            ("yarn.lock", True),
+            ("pnpm-lock.yaml", True),
+            ("npm-shrinkwrap.json", True),
+            # Python lockfiles
+            ("poetry.lock", True),
+            ("Pipfile.lock", True),
+            # Other language lockfiles
+            ("gradle.lockfile", True),
+            ("Gemfile.lock", True),
+            ("composer.lock", True),
+            ("Cargo.lock", True),
+            ("go.sum", True),
+            ("Package.resolved", True),
+            ("mix.lock", True),
+            ("packages.lock.json", True),
+            # Non-lockfiles
+            ("package.json", False),
+            ("requirements.txt", False),
+            ("main.py", False),
+        ],
+    )
+    def test_is_lockfile(self, path, expected):
         """Test lockfile detection."""
-        # JavaScript/Node.js lockfiles
-        assert FilePolicies.is_lockfile("package-lock.json") is True
-        assert FilePolicies.is_lockfile("yarn.lock") is True
-        assert FilePolicies.is_lockfile("pnpm-lock.yaml") is True
-        assert FilePolicies.is_lockfile("npm-shrinkwrap.json") is True
-
-        # Python lockfiles
-        assert FilePolicies.is_lockfile("poetry.lock") is True
-        assert FilePolicies.is_lockfile("Pipfile.lock") is True
-
-        # Other language lockfiles
-        assert FilePolicies.is_lockfile("gradle.lockfile") is True
-        assert FilePolicies.is_lockfile("Gemfile.lock") is True
-        assert FilePolicies.is_lockfile("composer.lock") is True
-        assert FilePolicies.is_lockfile("Cargo.lock") is True
-        assert FilePolicies.is_lockfile("go.sum") is True
-        assert FilePolicies.is_lockfile("Package.resolved") is True
-        assert FilePolicies.is_lockfile("mix.lock") is True
-        assert FilePolicies.is_lockfile("packages.lock.json") is True
-
-        # Non-lockfiles
-        assert FilePolicies.is_lockfile("package.json") is False
-        assert FilePolicies.is_lockfile("requirements.txt") is False
-        assert FilePolicies.is_lockfile("main.py") is False
-
-    def test_is_lockfile_with_path(self):
+        assert FilePolicies.is_lockfile(path) is expected
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "src/package-lock.json",
+            "frontend/yarn.lock",
+            "backend/poetry.lock",
+            "some/deep/path/Cargo.lock",
+        ],
+    )
+    def test_is_lockfile_with_path(self, path):
         """Test lockfile detection with full paths."""
-        assert FilePolicies.is_lockfile("src/package-lock.json") is True
-        assert FilePolicies.is_lockfile("frontend/yarn.lock") is True
-        assert FilePolicies.is_lockfile("backend/poetry.lock") is True
-        assert FilePolicies.is_lockfile("some/deep/path/Cargo.lock") is True
-
-    def test_is_minified(self):
+        assert FilePolicies.is_lockfile(path) is True
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("flake.lock", True),
+            ("tools/uv.lock", True),
+            ("buildscript-gradle.lockfile", True),
+            ("locker.py", False),
+            ("lock/main.py", False),
+        ],
+    )
+    def test_is_lockfile_by_suffix(self, path, expected):
+        """Test lockfile detection for unlisted names with lockfile suffixes."""
+        assert FilePolicies.is_lockfile(path) is expected
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("script.min.js", True),
+            ("style.min.css", True),
+            ("app.min.js", True),
+            # With paths
+            ("dist/app.min.js", True),
+            ("assets/style.min.css", True),
+            # Non-minified
+            ("script.js", False),
+            ("style.css", False),
+            ("app.ts", False),
+        ],
+    )
+    def test_is_minified(self, path, expected):
         """Test minified file detection."""
-        assert FilePolicies.is_minified("script.min.js") is True
-        assert FilePolicies.is_minified("style.min.css") is True
-        assert FilePolicies.is_minified("app.min.js") is True
-
-        # With paths
-        assert FilePolicies.is_minified("dist/app.min.js") is True
-        assert FilePolicies.is_minified("assets/style.min.css") is True
-
-        # Non-minified
-        assert FilePolicies.is_minified("script.js") is False
-        assert FilePolicies.is_minified("style.css") is False
-        assert FilePolicies.is_minified("app.ts") is False
-
-    def test_is_source_map(self):
+        assert FilePolicies.is_minified(path) is expected
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("script.js.map", True),
+            ("style.css.map", True),
+            ("app.map", True),
+            # With paths
+            ("dist/app.js.map", True),
+            ("assets/style.css.map", True),
+            # Non-source maps
+            ("script.js", False),
+            ("style.css", False),
+            ("config.json", False),
+        ],
+    )
+    def test_is_source_map(self, path, expected):
         """Test source map detection."""
-        assert FilePolicies.is_source_map("script.js.map") is True
-        assert FilePolicies.is_source_map("style.css.map") is True
-        assert FilePolicies.is_source_map("app.map") is True
-
-        # With paths
-        assert FilePolicies.is_source_map("dist/app.js.map") is True
-        assert FilePolicies.is_source_map("assets/style.css.map") is True
-
-        # Non-source maps
-        assert FilePolicies.is_source_map("script.js") is False
-        assert FilePolicies.is_source_map("style.css") is False
-        assert FilePolicies.is_source_map("config.json") is False
-
-    def test_is_generated_file(self):
+        assert FilePolicies.is_source_map(path) is expected
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            # Lockfiles
+            ("package-lock.json", True),
+            ("yarn.lock", True),
+            # Minified files
+            ("app.min.js", True),
+            ("style.min.css", True),
+            # Source maps
+            ("app.js.map", True),
+            ("style.css.map", True),
+            # Regular files
+            ("main.py", False),
+            ("index.html", False),
+            ("script.js", False),
+        ],
+    )
+    def test_is_generated_file(self, path, expected):
         """Test generated file detection."""
-        # Lockfiles
-        assert FilePolicies.is_generated_file("package-lock.json") is True
-        assert FilePolicies.is_generated_file("yarn.lock") is True
-
-        # Minified files
-        assert FilePolicies.is_generated_file("app.min.js") is True
-        assert FilePolicies.is_generated_file("style.min.css") is True
-
-        # Source maps
-        assert FilePolicies.is_generated_file("app.js.map") is True
-        assert FilePolicies.is_generated_file("style.css.map") is True
-
-        # Regular files
-        assert FilePolicies.is_generated_file("main.py") is False
-        assert FilePolicies.is_generated_file("index.html") is False
-        assert FilePolicies.is_generated_file("script.js") is False
-
-    def test_should_summarize_when_oversized(self):
+        assert FilePolicies.is_generated_file(path) is expected
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            # Generated files should be summarized
+            ("package-lock.json", True),
+            ("app.min.js", True),
+            ("style.js.map", True),
+            # Regular files should not be summarized
+            ("main.py", False),
+            ("index.html", False),
+            ("script.js", False),
+        ],
+    )
+    def test_should_summarize_when_oversized(self, path, expected):
         """Test summarization policy for oversized files."""
-        # Generated files should be summarized
-        assert FilePolicies.should_summarize_when_oversized("package-lock.json") is True
-        assert FilePolicies.should_summarize_when_oversized("app.min.js") is True
-        assert FilePolicies.should_summarize_when_oversized("style.js.map") is True
-
-        # Regular files should not be summarized
-        assert FilePolicies.should_summarize_when_oversized("main.py") is False
-        assert FilePolicies.should_summarize_when_oversized("index.html") is False
-        assert FilePolicies.should_summarize_when_oversized("script.js") is False
-
-    def test_get_file_category(self):
+        assert FilePolicies.should_summarize_when_oversized(path) is expected
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("package-lock.json", "lockfile"),
+            ("yarn.lock", "lockfile"),
+            ("app.min.js", "minified"),
+            ("style.min.css", "minified"),
+            ("app.js.map", "source_map"),
+            ("style.css.map", "source_map"),
+            ("main.py", "regular"),
+            ("index.html", "regular"),
+            ("script.js", "regular"),
+        ],
+    )
+    def test_get_file_category(self, path, expected):
         """Test file category classification."""
-        assert FilePolicies.get_file_category("package-lock.json") == "lockfile"
-        assert FilePolicies.get_file_category("yarn.lock") == "lockfile"
-
-        assert FilePolicies.get_file_category("app.min.js") == "minified"
-        assert FilePolicies.get_file_category("style.min.css") == "minified"
-
-        assert FilePolicies.get_file_category("app.js.map") == "source_map"
-        assert FilePolicies.get_file_category("style.css.map") == "source_map"
-
-        assert FilePolicies.get_file_category("main.py") == "regular"
-        assert FilePolicies.get_file_category("index.html") == "regular"
-        assert FilePolicies.get_file_category("script.js") == "regular"
+        assert FilePolicies.get_file_category(path) == expected
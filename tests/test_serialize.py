@@ -1,22 +1,27 @@
 """Tests for serialization module."""
 
+import base64
 import json
 
 import pytest
 
+from p1diff import serialize
 from p1diff.config import DiffConfig
 from p1diff.diffpack import DiffHunk, ProcessedFile
 from p1diff.serialize import DeterministicSerializer
 
 
+@pytest.fixture(scope="class")
+def serializer():
+    """Share one serializer per test class; it must hold no per-call state."""
+    return DeterministicSerializer(DiffConfig("repo", "good", "cand"))
+
+
 class TestDeterministicSerializer:
     """Test DeterministicSerializer class."""
 
-    def test_serialize_file_basic(self):
+    def test_serialize_file_basic(self, serializer):
         """Test basic file serialization."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         file = ProcessedFile(
             status="M",
             path_old="test.py",
@@ -43,11 +48,8 @@ class TestDeterministicSerializer:
         assert result["is_binary"] is False
         assert result["is_submodule"] is False
 
-    def test_serialize_file_with_rename(self):
+    def test_serialize_file_with_rename(self, serializer):
         """Test file serialization with rename information."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         file = ProcessedFile(
             status="R",
             path_old="old_name.py",
@@ -70,11 +72,8 @@ class TestDeterministicSerializer:
         assert result["rename_score"] == 95
         assert result["rename_tiebreaker"] == "path"
 
-    def test_serialize_file_with_flags(self):
+    def test_serialize_file_with_flags(self, serializer):
         """Test file serialization with various flags."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         file = ProcessedFile(
             status="M",
             path_old="test.py",
@@ -102,11 +101,8 @@ class TestDeterministicSerializer:
         assert "truncated" not in result  # False values not included
         assert result["omitted_hunks_count"] == 5
 
-    def test_serialize_file_with_submodule(self):
+    def test_serialize_file_with_submodule(self, serializer):
         """Test file serialization with submodule data."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         file = ProcessedFile(
             status="M",
             path_old="submodule",
@@ -127,11 +123,8 @@ class TestDeterministicSerializer:
         assert result["is_submodule"] is True
         assert result["submodule"] == {"old_sha": "abc123", "new_sha": "def456"}
 
-    def test_serialize_file_with_hunks(self):
+    def test_serialize_file_with_hunks(self, serializer):
         """Test file serialization with hunks."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         hunk1 = DiffHunk(
             header="@@ -1,1 +1,1 @@",
             old_start=1,
@@ -187,11 +180,8 @@ class TestDeterministicSerializer:
         assert hunks[0]["deleted"] == 1
         assert hunks[0]["patch"] == "@@ -1,1 +1,1 @@\n-old\n+new"
 
-    def test_file_sort_key(self):
+    def test_file_sort_key(self, serializer):
         """Test file sorting key generation."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         file1_data = {"path_new": "b.py", "status": "M"}
         file2_data = {"path_new": "a.py", "status": "M"}
         file3_data = {"path_old": "c.py", "path_new": None, "status": "D"}
@@ -257,9 +247,65 @@ class TestDeterministicSerializer:
         assert result["omitted_files_count"] == 0
         assert result["notes"] == ["test note"]
 
-    def test_checksum_computation(self):
+        # The single-pass checksum matches a full copy-and-normalize recompute
+        assert provenance["checksum"] == serializer._compute_checksum(result)
+
+    def test_serialize_output_reuses_config_provenance(self, serializer):
+        """Test repeated serialization does not leak into the cached provenance."""
+        first = serializer.serialize_output([], 0, [], "2.34.1")
+        second = serializer.serialize_output([], 0, [], "2.43.0")
+
+        assert first["provenance"]["git_version"] == "2.34.1"
+        assert second["provenance"]["git_version"] == "2.43.0"
+        assert "git_version" not in serializer.config.provenance
+        assert "checksum" not in serializer.config.provenance
+
+    def test_serialize_output_orders_files(self, serializer):
+        """Test files are emitted in sort-key order, deletions by old path."""
+
+        def make_file(status, path_old, path_new):
+            return ProcessedFile(
+                status=status,
+                path_old=path_old,
+                path_new=path_new,
+                rename_score=None,
+                rename_tiebreaker=None,
+                mode_old="100644",
+                mode_new="100644",
+                size_old=1,
+                size_new=1,
+                is_binary=False,
+                is_submodule=False,
+            )
+
+        files = [
+            make_file("M", "c.py", "c.py"),
+            make_file("D", "b.py", None),
+            make_file("A", None, "a.py"),
+        ]
+
+        result = serializer.serialize_output(files, 0, [], "2.34.1")
+
+        files_data = result["files"]
+        assert [f["path_new"] or f["path_old"] for f in files_data] == [
+            "a.py",
+            "b.py",
+            "c.py",
+        ]
+        assert files_data == sorted(files_data, key=serializer._file_sort_key)
+        assert result["provenance"]["checksum"] == serializer._compute_checksum(result)
+
+    @pytest.mark.parametrize("checksum_encoding", ["hex", "b64"])
+    @pytest.mark.parametrize("checksum_algo", ["sha256", "blake2b"])
+    def test_checksum_computation(self, checksum_algo, checksum_encoding):
         """Test checksum computation."""
-        config = DiffConfig("repo", "good", "cand")
+        config = DiffConfig(
+            "repo",
+            "good",
+            "cand",
+            checksum_algo=checksum_algo,
+            checksum_encoding=checksum_encoding,
+        )
         serializer = DeterministicSerializer(config)
 
         payload = {
@@ -275,15 +321,47 @@ class TestDeterministicSerializer:
 
         checksum = serializer._compute_checksum(payload)
 
-        # Should be a valid SHA-256 hex string
-        assert len(checksum) == 64
-        assert all(c in "0123456789abcdef" for c in checksum)
+        # Should be a valid 256-bit digest in the configured encoding
+        if checksum_encoding == "hex":
+            assert len(checksum) == 64
+            assert all(c in "0123456789abcdef" for c in checksum)
+        else:
+            assert len(checksum) == 44
+            assert len(base64.b64decode(checksum, validate=True)) == 32
+
+    @pytest.mark.parametrize("checksum_encoding", ["hex", "b64"])
+    @pytest.mark.parametrize("checksum_algo", ["sha256", "blake2b"])
+    def test_verify_checksum(self, checksum_algo, checksum_encoding):
+        """Test verification reads the checksum settings from provenance."""
+        config = DiffConfig(
+            "repo",
+            "good",
+            "cand",
+            checksum_algo=checksum_algo,
+            checksum_encoding=checksum_encoding,
+        )
+        result = DeterministicSerializer(config).serialize_output(
+            [], 0, ["note"], "2.34.1"
+        )
 
-    def test_deterministic_serialization(self):
-        """Test that serialization is deterministic."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
+        assert DeterministicSerializer.verify_checksum(result) is True
 
+        result["notes"] = ["tampered"]
+        assert DeterministicSerializer.verify_checksum(result) is False
+
+    def test_checksum_algorithms_differ(self):
+        """Test the configured algorithm selects the digest."""
+        payload = {"provenance": {}, "files": [], "omitted_files_count": 0, "notes": []}
+
+        sha256 = DeterministicSerializer(DiffConfig("repo", "good", "cand"))
+        blake2b = DeterministicSerializer(
+            DiffConfig("repo", "good", "cand", checksum_algo="blake2b")
+        )
+
+        assert sha256._compute_checksum(payload) != blake2b._compute_checksum(payload)
+
+    def test_deterministic_serialization(self, serializer):
+        """Test that serialization is deterministic."""
         payload = {
             "provenance": {
                 "repo_url": "test",
@@ -312,22 +390,37 @@ class TestDeterministicSerializer:
         assert parsed["files"][1]["path_new"] == "b.py"
         assert parsed["notes"] == ["note1", "note2"]  # Should be sorted
 
-    def test_success_envelope(self):
-        """Test success envelope creation."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_deterministic_json_bytes_match_stdlib_encoding(
+        self, serializer, monkeypatch, use_orjson
+    ):
+        """Test the JSON bytes are the compact, key-sorted stdlib encoding."""
+        if not use_orjson:
+            monkeypatch.setattr(serialize, "orjson", None)
+
+        payload = {
+            "b": ["café \u2028 \U0001F600", "tab\tquote\"", None, True, -1],
+            "a": {"size": 2**70, "path": "bad\udcffname"},
+        }
+        expected = json.dumps(
+            payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8", errors="replace")
+
+        assert serializer._to_deterministic_json_bytes(payload) == expected
+        assert serializer._to_deterministic_json_bytes(payload["b"]) == json.dumps(
+            payload["b"], ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
 
+    def test_success_envelope(self, serializer):
+        """Test success envelope creation."""
         payload = {"test": "data"}
         envelope = serializer.create_success_envelope(payload)
 
         assert envelope["ok"] is True
         assert envelope["data"] == payload
 
-    def test_error_envelope(self):
+    def test_error_envelope(self, serializer):
         """Test error envelope creation."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         envelope = serializer.create_error_envelope(
             "TEST_ERROR", "Test message", {"detail": "value"}
         )
@@ -337,14 +430,22 @@ class TestDeterministicSerializer:
         assert envelope["error"]["message"] == "Test message"
         assert envelope["error"]["details"] == {"detail": "value"}
 
-    def test_error_envelope_no_details(self):
+    def test_error_envelope_no_details(self, serializer):
         """Test error envelope creation without details."""
-        config = DiffConfig("repo", "good", "cand")
-        serializer = DeterministicSerializer(config)
-
         envelope = serializer.create_error_envelope("TEST_ERROR", "Test message")
 
         assert envelope["ok"] is False
         assert envelope["error"]["code"] == "TEST_ERROR"
         assert envelope["error"]["message"] == "Test message"
         assert "details" not in envelope["error"]
+
+    def test_envelopes_need_no_instance(self):
+        """Test envelopes can be built without a configured serializer."""
+        assert DeterministicSerializer.create_success_envelope({}) == {
+            "ok": True,
+            "data": {},
+        }
+        assert DeterministicSerializer.create_error_envelope("E", "msg") == {
+            "ok": False,
+            "error": {"code": "E", "message": "msg"},
+        }
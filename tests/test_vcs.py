@@ -0,0 +1,162 @@
+"""Tests for version control operations."""
+
+from p1diff.config import DiffConfig
+from p1diff.vcs import GitRepository
+
+
+def _open_repository(
+    git_helper, commit_good: str, commit_candidate: str
+) -> GitRepository:
+    """Create a GitRepository pointed at the helper's working repository."""
+    config = DiffConfig(str(git_helper.repo_path), commit_good, commit_candidate)
+    repo = GitRepository(config)
+    repo.workdir = git_helper.repo_path
+    return repo
+
+
+class TestGitRepository:
+    """Test GitRepository against a local synthetic repository."""
+
+    def test_get_file_changes_detects_binary_and_text(self, git_helper):
+        """Test binary detection from the batched numstat scan."""
+        git_helper.create_file("src/app.py", "print('v1')\n")
+        git_helper.create_binary_file("assets/logo.png")
+        commit_good = git_helper.add_and_commit("Add files")
+
+        git_helper.modify_file("src/app.py", "print('v2')\n")
+        (git_helper.repo_path / "assets/logo.png").write_bytes(
+            b"\x89PNG\r\n\x1a\n\x00\x01"
+        )
+        commit_candidate = git_helper.add_and_commit("Modify files")
+
+        repo = _open_repository(git_helper, commit_good, commit_candidate)
+        changes = {c.path_new: c for c in repo.get_file_changes()}
+
+        assert set(changes) == {"assets/logo.png", "src/app.py"}
+        assert changes["assets/logo.png"].is_binary is True
+        assert changes["src/app.py"].is_binary is False
+        assert changes["src/app.py"].status == "M"
+        assert changes["src/app.py"].mode_old == "100644"
+        assert changes["src/app.py"].mode_new == "100644"
+        assert changes["src/app.py"].size_new == len("print('v2')\n")
+
+    def test_get_file_changes_added_and_deleted(self, git_helper):
+        """Test null modes from raw output map to missing sides."""
+        git_helper.create_file("old.txt", "old\n")
+        commit_good = git_helper.add_and_commit("Add old")
+
+        git_helper.delete_file("old.txt")
+        git_helper.create_file("new.txt", "brand new content\n")
+        commit_candidate = git_helper.add_and_commit("Replace file")
+
+        repo = _open_repository(git_helper, commit_good, commit_candidate)
+        changes = {c.path_new or c.path_old: c for c in repo.get_file_changes()}
+
+        added = changes["new.txt"]
+        assert added.status == "A"
+        assert added.mode_old is None
+        assert added.mode_new == "100644"
+
+        deleted = changes["old.txt"]
+        assert deleted.status == "D"
+        assert deleted.mode_old == "100644"
+        assert deleted.mode_new is None
+        assert deleted.size_old == len("old\n")
+
+    def test_get_file_changes_submodule_from_raw_modes(self, git_helper):
+        """Test gitlink entries are detected without extra lookups."""
+        base_sha = git_helper.get_current_sha()
+        git_helper.run_git(
+            ["update-index", "--add", "--cacheinfo", f"160000,{base_sha},vendor/lib"]
+        )
+        git_helper.run_git(["commit", "-m", "Add submodule"])
+        commit_good = git_helper.get_current_sha()
+
+        new_target = git_helper.get_current_sha()
+        git_helper.run_git(
+            ["update-index", "--cacheinfo", f"160000,{new_target},vendor/lib"]
+        )
+        git_helper.run_git(["commit", "-m", "Bump submodule"])
+        commit_candidate = git_helper.get_current_sha()
+
+        repo = _open_repository(git_helper, commit_good, commit_candidate)
+        changes = repo.get_file_changes()
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change.is_submodule is True
+        assert change.is_binary is False
+        assert change.mode_new == "160000"
+        assert change.submodule_old_sha == base_sha
+        assert change.submodule_new_sha == new_target
+
+    def test_get_unified_diff_sliced_from_single_diff(self, git_helper):
+        """Test per-file diffs are sliced out of one batched git diff."""
+        body = "".join(f"line {i}\n" for i in range(40))
+        git_helper.create_file("a.txt", "alpha\n")
+        git_helper.create_file("b.txt", "beta\n")
+        git_helper.create_file("moved/before.txt", body)
+        commit_good = git_helper.add_and_commit("Add files")
+
+        git_helper.modify_file("a.txt", "alpha changed\n")
+        git_helper.delete_file("b.txt")
+        git_helper.delete_file("moved/before.txt")
+        git_helper.create_file(
+            "moved/after.txt", body.replace("line 5\n", "line five\n")
+        )
+        commit_candidate = git_helper.add_and_commit("Change files")
+
+        repo = _open_repository(git_helper, commit_good, commit_candidate)
+        changes = {c.path_new or c.path_old: c for c in repo.get_file_changes()}
+
+        diff_a = repo.get_unified_diff(changes["a.txt"])
+        assert diff_a.startswith("diff --git a.txt a.txt\n")
+        assert "-alpha\n+alpha changed\n" in diff_a
+        assert "beta" not in diff_a
+
+        diff_b = repo.get_unified_diff(changes["b.txt"])
+        assert "-beta\n" in diff_b
+        assert "alpha" not in diff_b
+
+        renamed = changes["moved/after.txt"]
+        assert renamed.status == "R"
+        diff_renamed = repo.get_unified_diff(renamed)
+        assert "rename to moved/after.txt" in diff_renamed
+        assert "-line 5\n+line five\n" in diff_renamed
+
+    def test_special_character_paths_round_trip(self, git_helper):
+        """Test NUL-separated records and quoted diff headers agree on paths."""
+        git_helper.create_file("café notes.txt", "one\n")
+        git_helper.create_file("tab\tname.txt", "two\n")
+        commit_good = git_helper.add_and_commit("Add files")
+
+        git_helper.modify_file("café notes.txt", "uno\n")
+        git_helper.modify_file("tab\tname.txt", "dos\n")
+        commit_candidate = git_helper.add_and_commit("Translate files")
+
+        repo = _open_repository(git_helper, commit_good, commit_candidate)
+        changes = {c.path_new: c for c in repo.get_file_changes()}
+
+        assert set(changes) == {"café notes.txt", "tab\tname.txt"}
+        assert changes["café notes.txt"].size_new == len("uno\n")
+        assert "-one\n+uno\n" in repo.get_unified_diff(changes["café notes.txt"])
+        assert "-two\n+dos\n" in repo.get_unified_diff(changes["tab\tname.txt"])
+
+    def test_type_change_diff_keeps_both_sections(self, git_helper):
+        """Test a file replaced by a symlink keeps its delete and add sections."""
+        git_helper.create_file("config.txt", "real content\n")
+        commit_good = git_helper.add_and_commit("Add config")
+
+        git_helper.delete_file("config.txt")
+        (git_helper.repo_path / "config.txt").symlink_to("README.md")
+        commit_candidate = git_helper.add_and_commit("Link config")
+
+        repo = _open_repository(git_helper, commit_good, commit_candidate)
+        (change,) = repo.get_file_changes()
+        assert change.status == "T"
+
+        diff = repo.get_unified_diff(change)
+        assert "deleted file mode 100644" in diff
+        assert "-real content\n" in diff
+        assert "new file mode 120000" in diff
+        assert "+README.md" in diff